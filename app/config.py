@@ -17,3 +17,10 @@ SITE_BASE_URL  = os.environ.get("SITE_BASE_URL", "http://localhost:10000")
 TIMEZONE       = os.environ.get("TIMEZONE", "America/New_York")
 USER_AGENT     = os.environ.get("USER_AGENT", "BuildingTheFutureBot/1.0")
 MAX_ARTICLES_PER_RUN = int(os.environ.get("MAX_ARTICLES_PER_RUN", "900"))
+
+# Scoring is high-volume structured classification, so it runs on a small model
+# (optionally an OpenAI-compatible server such as vLLM via LLM_SCORING_BASE_URL);
+# the larger model is kept for the few synthesis calls
+LLM_SCORING_MODEL     = os.environ.get("LLM_SCORING_MODEL", "gpt-4.1-nano")
+LLM_SCORING_BASE_URL  = os.environ.get("LLM_SCORING_BASE_URL", "")
+LLM_SYNTHESIS_MODEL   = os.environ.get("LLM_SYNTHESIS_MODEL", "gpt-4o-mini")
@@ -1,8 +1,13 @@
 from urllib.parse import urljoin, urlparse
+import asyncio
+import calendar
 import json
+import logging
 import pathlib
 import re
-import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import chain
 from typing import Optional
 from datetime import datetime, timezone, timedelta
 
@@ -16,16 +21,19 @@ from trafilatura import extract as t_extract
 from sqlalchemy import text
 
 from .config import USER_AGENT, MAX_ARTICLES_PER_RUN
-from .db import SessionLocal
+from .db import SessionLocal, init_db
 from .utils import canonicalize_url, sha1
 from .cse_client import search_construction_news
 
+log = logging.getLogger(__name__)
+
 HEADERS = {"User-Agent": USER_AGENT}
 
 # Limits
 TOP_K = 8                              # per seed page/feed
 FRESH_WINDOW = timedelta(hours=72)     # widen now; tighten later if you want
 MAX_PER_DOMAIN_PER_RUN = 8             # hard cap per registrable domain per ingest run
+MIN_BODY_WORDS = 180                   # shorter bodies are treated as teasers
 
 # Optional dependency for robust domain normalization
 try:
@@ -33,6 +41,12 @@ try:
 except Exception:
     tldextract = None
 
+# Optional faster JSON parser
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None
+
 def _registrable_domain(host: str) -> str:
     host = (host or "").lower().strip()
     for pfx in ("www.", "amp.", "m.", "mobile.", "news.", "beta."):
@@ -171,6 +185,20 @@ def _extract_html(url: str, html: str) -> tuple[str, str]:
         body = "\n".join(p_tags)
     return (title or url, body)
 
+_NON_TEXT_TAGS = ("script", "style", "noscript")
+
+def _entry_text(entry) -> str:
+    """Plain text of an RSS entry's full content (or summary), if the feed ships it."""
+    contents = entry.get("content") or []
+    raw = contents[0].get("value", "") if contents else entry.get("summary", "")
+    if not raw:
+        return ""
+    # Feeds are parsed with sanitize_html=False, so drop non-text markup here
+    soup = BeautifulSoup(raw, "lxml")
+    for tag in soup(_NON_TEXT_TAGS):
+        tag.decompose()
+    return soup.get_text(" ", strip=True)
+
 def _detect_published(soup: BeautifulSoup) -> Optional[str]:
     for key in ("article:published_time", "og:pubdate", "pubdate", "date", "timestamp"):
         tag = soup.find("meta", {"property": key}) or soup.find("meta", {"name": key})
@@ -288,6 +316,17 @@ def _is_fresh(published_iso: Optional[str], now_utc: datetime) -> bool:
     except Exception:
            return False
 
+SEED_FETCH_CONCURRENCY = 20
+
+async def _fetch_seeds(urls: list[str]) -> list:
+    limits = httpx.Limits(max_connections=SEED_FETCH_CONCURRENCY)
+    async with httpx.AsyncClient(headers=HEADERS, timeout=20, follow_redirects=True, limits=limits) as client:
+        return await asyncio.gather(*(client.get(u) for u in urls), return_exceptions=True)
+
+def _prefetch_seeds(urls: list[str]) -> dict:
+    """Fetch all seed URLs concurrently; maps url -> httpx.Response or the exception raised"""
+    return dict(zip(urls, asyncio.run(_fetch_seeds(urls))))
+
 def maybe_insert_article(url: str, client: httpx.Client, db, inserted_counter, attempts_counter, domain_counts, cap, now_utc, fallback_published_iso: Optional[str] = None):
     """Helper function to insert an article if it meets criteria"""
     if inserted_counter[0] >= cap:
@@ -298,7 +337,7 @@ def maybe_insert_article(url: str, client: httpx.Client, db, inserted_counter, a
     host = _registrable_domain(host_raw)
 
     if domain_counts.get(host, 0) >= MAX_PER_DOMAIN_PER_RUN:
-        print(f"[crawler] domain-cap reached for {host}; skipping {u}")
+        log.debug(f"[crawler] domain-cap reached for {host}; skipping {u}")
         return False
 
     attempts_counter[0] += 1
@@ -313,7 +352,7 @@ def maybe_insert_article(url: str, client: httpx.Client, db, inserted_counter, a
         
         # Skip if no meaningful title
         if not title or len(title.strip()) < 10:
-            print(f"[crawler] insufficient title for {u}; skipping")
+            log.debug(f"[crawler] insufficient title for {u}; skipping")
             return False
         
         # Fallback to trafilatura for content if readability fails or is empty
@@ -323,7 +362,7 @@ def maybe_insert_article(url: str, client: httpx.Client, db, inserted_counter, a
             body_text = BeautifulSoup(body_html, "lxml").get_text(separator="\n")
 
         if not body_text or len(body_text.strip()) < 500:  # Minimum 500 characters of content
-            print(f"[crawler] insufficient content for {u} (length: {len(body_text) if body_text else 0}); skipping")
+            log.debug(f"[crawler] insufficient content for {u} (length: {len(body_text) if body_text else 0}); skipping")
             return False
 
         # Language detection
@@ -352,7 +391,7 @@ def maybe_insert_article(url: str, client: httpx.Client, db, inserted_counter, a
 
         # Check freshness
         if not _is_fresh(dp.parse(published_iso), now_utc):
-            print(f"[crawler] stale {u}; skipping")
+            log.debug(f"[crawler] stale {u}; skipping")
             return False
 
         sql = text("""
@@ -378,74 +417,104 @@ def maybe_insert_article(url: str, client: httpx.Client, db, inserted_counter, a
         if row:
             inserted_counter[0] += 1
             domain_counts[host] = domain_counts.get(host, 0) + 1
-            print(f"[crawler] INSERTED {u} (domain {host}: {domain_counts[host]}/{MAX_PER_DOMAIN_PER_RUN})")
+            log.info(f"[crawler] INSERTED {u} (domain {host}: {domain_counts[host]}/{MAX_PER_DOMAIN_PER_RUN})")
             return True
         else:
-            print(f"[crawler] duplicate/no-op {u}")
+            log.debug(f"[crawler] duplicate/no-op {u}")
             return False
 
     except Exception as e:
-        print(f"[crawler] error for {u}: {e}")
+        log.warning(f"[crawler] error for {u}: {e}")
         return False
 
+# Innovation/Engineering search queries
+GOOGLE_INNOVATION_QUERIES = (
+    "3d printed home",
+    "straw homes",
+    "rammed earth homes",
+    "engineering construction news",
+)
+
+# Opportunities search queries
+GOOGLE_OPPORTUNITY_QUERIES = (
+    "Real Estate Opportunities News",
+    "3d printed home News",
+    "straw homes News",
+    "rammed earth homes News",
+    "engineering construction news",
+)
+
+GOOGLE_QUERIES = tuple(chain(GOOGLE_INNOVATION_QUERIES, GOOGLE_OPPORTUNITY_QUERIES))
+GOOGLE_SEARCH_CONCURRENCY = 5
+
 def crawl_google_searches(limit: int, db, inserted_counter, attempts_counter, domain_counts, cap, now_utc) -> int:
     """Crawl articles using Google search queries for innovation and opportunities"""
     print(f"[google] Starting Google search crawl, limit={limit}")
     
-    # Innovation/Engineering search queries
-    innovation_queries = [
-        "3d printed home",
-        "straw homes", 
-        "rammed earth homes",
-        "engineering construction news"
-    ]
-    
-    # Opportunities search queries
-    opportunity_queries = [
-        "Real Estate Opportunities News",
-        "3d printed home News",
-        "straw homes News", 
-        "rammed earth homes News",
-        "engineering construction news"
-    ]
-    
-    all_queries = innovation_queries + opportunity_queries
-    
-    with httpx.Client(headers=HEADERS, timeout=30.0, follow_redirects=True) as client:
-        for query in all_queries:
+    # Run the CSE searches in small concurrent waves; inserts stay sequential
+    # because they share one DB session. No further wave is sent once the limit
+    # is reached, so a crawl only spends the CSE quota it actually needs.
+    def _search(query: str):
+        print(f"[google] Searching: {query}")
+        try:
+            return search_construction_news(query, num=5), None
+        except Exception as e:
+            return None, e
+
+    with ThreadPoolExecutor(max_workers=GOOGLE_SEARCH_CONCURRENCY) as pool, \
+            httpx.Client(headers=HEADERS, timeout=30.0, follow_redirects=True) as client:
+        for start in range(0, len(GOOGLE_QUERIES), GOOGLE_SEARCH_CONCURRENCY):
             if inserted_counter[0] >= limit:
                 break
-                
-            try:
-                print(f"[google] Searching: {query}")
-                results = search_construction_news(query, num=5)
-                
-                for result in results:
-                    if inserted_counter[0] >= limit:
-                        break
-                    try:
-                        maybe_insert_article(result["url"], client, db, inserted_counter, attempts_counter, domain_counts, cap, now_utc)
-                        if inserted_counter[0] % 10 == 0:
-                            print(f"[google] Inserted {inserted_counter[0]} articles so far")
-                    except Exception as e:
-                        print(f"[google] Error processing {result['url']}: {e}")
-                        
-            except Exception as e:
-                print(f"[google] Error searching '{query}': {e}")
+            wave = GOOGLE_QUERIES[start:start + GOOGLE_SEARCH_CONCURRENCY]
+            
+            for query, (results, search_error) in zip(wave, pool.map(_search, wave)):
+                if inserted_counter[0] >= limit:
+                    break
+                    
+                try:
+                    if search_error:
+                        raise search_error
+                    
+                    for result in results:
+                        if inserted_counter[0] >= limit:
+                            break
+                        try:
+                            maybe_insert_article(result["url"], client, db, inserted_counter, attempts_counter, domain_counts, cap, now_utc)
+                            if inserted_counter[0] % 10 == 0:
+                                print(f"[google] Inserted {inserted_counter[0]} articles so far")
+                        except Exception as e:
+                            log.warning(f"[google] Error processing {result['url']}: {e}")
+                            
+                except Exception as e:
+                    log.warning(f"[google] Error searching '{query}': {e}")
                 
     print(f"[google] Google search crawl complete: {inserted_counter[0]} articles inserted")
     return inserted_counter[0]
 
-def ingest_run(limit: Optional[int] = None) -> int:
+@lru_cache(maxsize=1)
+def _load_seed_cfg() -> dict:
+    """seeds.json is static for the life of the process; parse it once"""
+    seeds_path = pathlib.Path(__file__).with_name("seeds.json")
+    if orjson:
+        return orjson.loads(seeds_path.read_bytes())
+    with seeds_path.open() as f:
+        return json.load(f)
+
+def ingest_run(limit: Optional[int] = None, extra_feeds: Optional[list[dict]] = None) -> int:
+    """Crawl the seed feeds/pages (plus any ``extra_feeds``, dicts with a "url") and
+    then Google searches, inserting up to ``limit`` articles."""
     cap = int(limit or MAX_ARTICLES_PER_RUN)
     now_utc = datetime.now(timezone.utc)
 
+    init_db()
     db = SessionLocal()
     db.execute(text("SELECT 1"))
 
-    seeds_path = pathlib.Path(__file__).with_name("seeds.json")
-    with seeds_path.open() as f:
-        seed_cfg = json.load(f)
+    seed_cfg = _load_seed_cfg()
+    if extra_feeds:
+        # new dict so the cached config is never mutated
+        seed_cfg = {**seed_cfg, "extra_feeds": [feed["url"] for feed in extra_feeds]}
 
     print(f"[crawler] cap={cap}, seeds={sum(len(v) for v in seed_cfg.values())} lists")
     
@@ -459,7 +528,11 @@ def ingest_run(limit: Optional[int] = None) -> int:
     attempts_counter = [0]
     domain_counts: dict[str, int] = {}
 
-    def maybe_insert(url: str, client: httpx.Client, fallback_published_iso: Optional[str] = None):
+    def maybe_insert(url: str, client: httpx.Client, fallback_published_iso: Optional[str] = None,
+                     feed_entry: Optional[tuple[str, str, str]] = None):
+        """Insert one article. ``feed_entry`` is ``(title, body_text, source)`` taken
+        from an RSS entry that already carries the full text; when given, the page
+        fetch and HTML extraction are skipped."""
         if inserted_counter[0] >= cap:
             return
 
@@ -468,35 +541,46 @@ def ingest_run(limit: Optional[int] = None) -> int:
         host = _registrable_domain(host_raw)
 
         if domain_counts.get(host, 0) >= MAX_PER_DOMAIN_PER_RUN:
-            print(f"[crawler] domain-cap reached for {host}; skipping {u}")
+            log.debug(f"[crawler] domain-cap reached for {host}; skipping {u}")
             return
 
         if not _likely_article(u):
-            print(f"[crawler] skip non-article-url {u}")
+            log.debug(f"[crawler] skip non-article-url {u}")
             return
 
         attempts_counter[0] += 1
         try:
-            r = client.get(u, follow_redirects=True, timeout=20)
-            if r.status_code >= 400 or not r.text:
-                print(f"[crawler] skip fetch-failed {u} status={r.status_code}")
-                return
+            if feed_entry:
+                title, body_text, source = feed_entry
+                summary_raw = body_text[:1000]
+                published_iso = fallback_published_iso
+                if not _is_fresh(published_iso, now_utc):
+                    log.debug(f"[crawler] skip stale-or-undated {u} published={published_iso}")
+                    return
+            else:
+                r = client.get(u, follow_redirects=True, timeout=20)
+                if r.status_code >= 400 or not r.text:
+                    log.debug(f"[crawler] skip fetch-failed {u} status={r.status_code}")
+                    return
 
-            html = r.text
-            soup = BeautifulSoup(html, "lxml")
+                html = r.text
+                soup = BeautifulSoup(html, "lxml")
 
-            if not _is_article_by_meta(soup) and not _path_articleish(u):
-                print(f"[crawler] skip not-article-by-meta {u}")
-                return
+                if not _is_article_by_meta(soup) and not _path_articleish(u):
+                    log.debug(f"[crawler] skip not-article-by-meta {u}")
+                    return
 
-            published_iso = _detect_published(soup) or fallback_published_iso
-            if not _is_fresh(published_iso, now_utc):
-                print(f"[crawler] skip stale-or-undated {u} published={published_iso}")
-                return
+                published_iso = _detect_published(soup) or fallback_published_iso
+                if not _is_fresh(published_iso, now_utc):
+                    log.debug(f"[crawler] skip stale-or-undated {u} published={published_iso}")
+                    return
 
-            title, body_text = _extract_html(u, html)
-            if not body_text or len(body_text.split()) < 180:
-                print(f"[crawler] skip too-short {u}")
+                title, body_text = _extract_html(u, html)
+                source = (soup.find("meta", {"property": "og:site_name"}) or {}).get("content") or host_raw
+                summary_raw = (soup.find("meta", {"name": "description"}) or {}).get("content", "")
+
+            if not body_text or len(body_text.split()) < MIN_BODY_WORDS:
+                log.debug(f"[crawler] skip too-short {u}")
                 return
 
             try:
@@ -504,7 +588,7 @@ def ingest_run(limit: Optional[int] = None) -> int:
             except Exception:
                 lang = "unknown"
             if lang != "en":
-                print(f"[crawler] skip non-en {u} lang={lang}")
+                log.debug(f"[crawler] skip non-en {u} lang={lang}")
                 return
 
             sql = text("""
@@ -517,10 +601,9 @@ def ingest_run(limit: Optional[int] = None) -> int:
             """)
             res = db.execute(sql, {
                 "url": u,
-                "source": (soup.find("meta", {"property": "og:site_name"}) or {}).get("content")
-                          or (urlparse(u).netloc),
+                "source": source,
                 "title": (title or "")[:500],
-                "summary_raw": ((soup.find("meta", {"name": "description"}) or {}).get("content", ""))[:1000],
+                "summary_raw": (summary_raw or "")[:1000],
                 "content": body_text[:50000],
                 "published_at": published_iso,
                 "canonical_hash": sha1(u),
@@ -530,18 +613,28 @@ def ingest_run(limit: Optional[int] = None) -> int:
             if row:
                 inserted_counter[0] += 1
                 domain_counts[host] = domain_counts.get(host, 0) + 1
-                print(f"[crawler] INSERTED {u} (domain {host}: {domain_counts[host]}/{MAX_PER_DOMAIN_PER_RUN})")
+                log.info(f"[crawler] INSERTED {u} (domain {host}: {domain_counts[host]}/{MAX_PER_DOMAIN_PER_RUN})")
             else:
-                print(f"[crawler] duplicate/no-op {u}")
+                log.debug(f"[crawler] duplicate/no-op {u}")
 
         except Exception as e:
-            print(f"[crawler] error for {u}: {e}")
+            log.warning(f"[crawler] error for {u}: {e}")
             return
 
     with httpx.Client(headers=HEADERS, timeout=20) as client:
         # Prioritize tier_1_sources and new high-quality categories first
-        priority_categories = ["tier_1_sources", "innovation_engineering", "insights_sources", "economy_news"]
+        priority_categories = ["tier_1_sources", "innovation_engineering", "insights_sources", "economy_news", "extra_feeds"]
         other_categories = [k for k in seed_cfg.keys() if k not in priority_categories]
+
+        # Several seeds are listed under more than one category; map each URL to the
+        # first priority category that lists it so it is only fetched once per run.
+        seed_category: dict[str, str] = {}
+        for category in priority_categories:
+            for base in seed_cfg.get(category, ()):
+                seed_category.setdefault(base, category)
+
+        # Fetch every seed page/feed up front, concurrently
+        seed_pages = _prefetch_seeds(list(seed_category))
         
         # Process priority categories first
         for category in priority_categories:
@@ -550,11 +643,18 @@ def ingest_run(limit: Optional[int] = None) -> int:
                 for base in seed_cfg[category]:
                     if inserted_counter[0] >= cap:
                         break
+                    if seed_category[base] != category:
+                        continue
                     try:
-                        fp = feedparser.parse(base)
-
-                        if fp.bozo or not getattr(fp, "entries", None):
-                            r = client.get(base, follow_redirects=True)
+                        # Hand feedparser the prefetched raw bytes; we do our own
+                        # extraction, so skip its HTML sanitizer. A bozo flag alone
+                        # (e.g. a charset mismatch) is not a reason to drop parsed entries.
+                        r = seed_pages[base]
+                        if isinstance(r, Exception):
+                            raise r
+                        fp = feedparser.parse(r.content, sanitize_html=False) if r.status_code < 400 else None
+
+                        if fp is None or not fp.entries:
                             if r.status_code < 400 and r.text:
                                 soup = BeautifulSoup(r.text, "lxml")
                                 base_host = _registrable_domain(urlparse(base).netloc.lower())
@@ -599,17 +699,19 @@ def ingest_run(limit: Optional[int] = None) -> int:
                                 if not link:
                                     continue
 
-                                fb = e.get("published") or e.get("updated") or e.get("pubDate")
+                                # feedparser already normalised the date to a UTC struct_time;
+                                # only fall back to dateutil when it couldn't.
                                 fb_iso = None
                                 try:
-                                    if fb:
-                                        fb_iso = dp.parse(fb).isoformat()
+                                    tp = e.get("published_parsed") or e.get("updated_parsed")
+                                    if tp:
+                                        fb_iso = datetime.fromtimestamp(
+                                            calendar.timegm(tp), tz=timezone.utc
+                                        ).isoformat()
                                     else:
-                                        tp = e.get("published_parsed") or e.get("updated_parsed")
-                                        if tp:
-                                            fb_iso = datetime.fromtimestamp(
-                                                time.mktime(tp), tz=timezone.utc
-                                            ).isoformat()
+                                        fb = e.get("published") or e.get("updated") or e.get("pubDate")
+                                        if fb:
+                                            fb_iso = dp.parse(fb).isoformat()
                                 except Exception:
                                     fb_iso = None
 
@@ -617,12 +719,21 @@ def ingest_run(limit: Optional[int] = None) -> int:
                                 if domain_counts.get(host_check, 0) >= MAX_PER_DOMAIN_PER_RUN:
                                     continue
 
-                                maybe_insert(link, client, fallback_published_iso=fb_iso)
+                                # Full-text feeds already give us the body; only fetch the
+                                # page when the entry is a teaser or undated.
+                                feed_entry = None
+                                if fb_iso and _likely_article(canonicalize_url(link)):
+                                    body = _entry_text(e)
+                                    if len(body.split()) >= MIN_BODY_WORDS:
+                                        source = fp.feed.get("title") or urlparse(link).netloc
+                                        feed_entry = (e.get("title") or link, body, source)
+
+                                maybe_insert(link, client, fallback_published_iso=fb_iso, feed_entry=feed_entry)
                                 if inserted_counter[0] >= cap:
                                     break
 
                     except Exception as e:
-                        print(f"[crawler] seed error for {base}: {e}")
+                        log.warning(f"[crawler] seed error for {base}: {e}")
                         continue
 
         # Run Google searches if we haven't reached the RSS limit
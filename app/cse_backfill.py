@@ -11,12 +11,20 @@ from .cse_client import search_construction_news, get_quota_status
 from .db import SessionLocal
 from sqlalchemy import text
 
+# Optional faster JSON parser
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None
+
 # Load CSE queries
 QUERIES_PATH = pathlib.Path(__file__).parent / "cse_queries.json"
 
 def load_cse_queries() -> Dict[str, List[str]]:
     """Load curated CSE search queries"""
     try:
+        if orjson:
+            return orjson.loads(QUERIES_PATH.read_bytes())
         with QUERIES_PATH.open() as f:
             return json.load(f)
     except FileNotFoundError:
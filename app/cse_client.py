@@ -3,8 +3,11 @@
 # - Caches results locally (sqlite file) for 24h
 # - Simple daily quota guard so you don't burn credits
 
-import os, json, time, hashlib, sqlite3, pathlib, requests
+import os, json, time, hashlib, sqlite3, pathlib, threading, requests
+from collections import OrderedDict
 from typing import List, Dict, Optional
+from urllib.parse import urlparse
+from requests.adapters import HTTPAdapter
 
 # FIXED: Environment variable names should match the actual env var names
 GOOGLE_API_KEY = os.environ.get("GOOGLE_CSE_API_KEY")        # <-- set in env
@@ -16,42 +19,97 @@ DATA_DIR = pathlib.Path(os.environ.get("CSE_DATA_DIR", ".cse_store"))
 DATA_DIR.mkdir(parents=True, exist_ok=True)
 DB_PATH = DATA_DIR / "cse_cache.sqlite"
 
+CSE_ENDPOINT = "https://www.googleapis.com/customsearch/v1"
+
+# One pooled session so back-to-back CSE queries reuse the HTTPS connection
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=2, pool_maxsize=10))
+_SESSION.headers.update({"Accept": "application/json"})
+
+# Connections are kept per thread (sqlite3 objects can't cross threads) and
+# reused across calls so the page cache stays warm; schema DDL runs once.
+_tls = threading.local()
+_inited = False
+_init_lock = threading.Lock()
+
 def _open_db():
+    global _inited
+    conn = getattr(_tls, "conn", None)
+    if conn is not None:
+        return conn
     conn = sqlite3.connect(DB_PATH)
-    conn.execute("""
-    CREATE TABLE IF NOT EXISTS cache (
-      key TEXT PRIMARY KEY,
-      value TEXT NOT NULL,
-      ts INTEGER NOT NULL
-    )""")
-    conn.execute("""
-    CREATE TABLE IF NOT EXISTS quota (
-      day TEXT PRIMARY KEY,
-      used INTEGER NOT NULL
-    )""")
-    conn.commit()
+    # WAL lets readers on other threads proceed while one writes, and with
+    # synchronous=NORMAL a commit no longer fsyncs a rollback journal.
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-64000")
+    conn.execute("PRAGMA mmap_size=268435456")
+    with _init_lock:
+        if not _inited:
+            conn.execute("""
+            CREATE TABLE IF NOT EXISTS cache (
+              key TEXT PRIMARY KEY,
+              value TEXT NOT NULL,
+              ts INTEGER NOT NULL
+            )""")
+            conn.execute("""
+            CREATE TABLE IF NOT EXISTS quota (
+              day TEXT PRIMARY KEY,
+              used INTEGER NOT NULL
+            )""")
+            # rows keyed by the old 64-char sha256 digests can never be hit again
+            conn.execute("DELETE FROM cache WHERE length(key) != 32")
+            conn.commit()
+            _inited = True
+    _tls.conn = conn
     return conn
 
+# In-process layer in front of the sqlite cache: key -> (ts, results)
+MEM_CACHE_MAX = 1024
+_MEM_CACHE: "OrderedDict[str, tuple[int, List[Dict]]]" = OrderedDict()
+_mem_lock = threading.Lock()
+
+def _mem_get(key: str, now: int) -> Optional[List[Dict]]:
+    with _mem_lock:
+        hit = _MEM_CACHE.get(key)
+        if not hit or now - hit[0] >= CACHE_TTL_SEC:
+            return None
+        _MEM_CACHE.move_to_end(key)
+    # callers annotate results in place, so hand out copies
+    return [dict(r) for r in hit[1]]
+
+def _mem_put(key: str, ts: int, out: List[Dict]) -> None:
+    with _mem_lock:
+        _MEM_CACHE[key] = (ts, [dict(r) for r in out])
+        _MEM_CACHE.move_to_end(key)
+        while len(_MEM_CACHE) > MEM_CACHE_MAX:
+            _MEM_CACHE.popitem(last=False)
+
 def _k(cx: str, q: str, num: int, site: Optional[str]) -> str:
-    h = hashlib.sha256(f"{cx}|{q}|{num}|{site or ''}".encode()).hexdigest()
+    # local lookup key only, no cryptographic requirement
+    h = hashlib.blake2b(f"{cx}|{q}|{num}|{site or ''}".encode(), digest_size=16).hexdigest()
     return h
 
 def _today():
     return time.strftime("%Y-%m-%d")
 
 def _quota_try_consume(conn, n=1) -> bool:
-    day = _today()
-    cur = conn.cursor()
-    row = cur.execute("SELECT used FROM quota WHERE day=?", (day,)).fetchone()
-    used = row[0] if row else 0
-    if used + n > CSE_DAILY_MAX:
+    # Single atomic UPSERT: the WHERE guard leaves the row untouched (and returns
+    # nothing) once the daily budget would be exceeded. That guard only covers
+    # the UPDATE branch, so a request that could never fit is refused up front
+    # rather than letting the day's first INSERT through.
+    if n > CSE_DAILY_MAX:
         return False
-    if row:
-        cur.execute("UPDATE quota SET used=? WHERE day=?", (used + n, day))
-    else:
-        cur.execute("INSERT INTO quota(day, used) VALUES(?,?)", (day, n))
-    conn.commit()
-    return True
+    day = _today()
+    with conn:
+        row = conn.execute("""
+            INSERT INTO quota(day, used) VALUES(?, ?)
+            ON CONFLICT(day) DO UPDATE SET used = used + excluded.used
+            WHERE used + excluded.used <= ?
+            RETURNING used
+        """, (day, n, CSE_DAILY_MAX)).fetchone()
+    return row is not None
 
 def get_quota_status() -> Dict[str, int]:
     """Get current quota usage for monitoring"""
@@ -59,7 +117,6 @@ def get_quota_status() -> Dict[str, int]:
     day = _today()
     row = conn.execute("SELECT used FROM quota WHERE day=?", (day,)).fetchone()
     used = row[0] if row else 0
-    conn.close()
     return {"used": used, "limit": CSE_DAILY_MAX, "remaining": CSE_DAILY_MAX - used}
 
 def cse_search(q: str, *, cx: Optional[str]=None, num: int=5, site: Optional[str]=None) -> List[Dict]:
@@ -81,109 +138,115 @@ def cse_search(q: str, *, cx: Optional[str]=None, num: int=5, site: Optional[str
     if not cx:
         raise RuntimeError("GOOGLE_CSE_CX_ID missing. Set your Programmable Search 'cx' in env.")
 
+    num = min(max(num,1),10)
+    key = _k(cx, q, num, site)
+    now = int(time.time())
+
+    cached = _mem_get(key, now)
+    if cached is not None:
+        return cached
+
     conn = _open_db()
-    try:
-        key = _k(cx, q, min(max(num,1),10), site)
-        now = int(time.time())
-
-        # cache hit?
-        row = conn.execute("SELECT value, ts FROM cache WHERE key=?", (key,)).fetchone()
-        if row:
-            value, ts = row
-            if now - ts < CACHE_TTL_SEC:
-                conn.close()
-                return json.loads(value)
-
-        # quota check
-        if not _quota_try_consume(conn, 1):
-            # out of budget → return stale cache if any, else empty
-            if row:
-                conn.close()
-                return json.loads(row[0])
-            conn.close()
-            return []
-
-        params = {
-            "key": GOOGLE_API_KEY, 
-            "cx": cx, 
-            "q": q, 
-            "num": min(max(num,1),10)
-        }
-        if site:
-            params["siteSearch"] = site
-
-        try:
-            r = requests.get("https://www.googleapis.com/customsearch/v1", params=params, timeout=15)
-            r.raise_for_status()
-            data = r.json()
-            
-            # Handle API errors
-            if "error" in data:
-                print(f"CSE API Error: {data['error']}")
-                if row:  # Return stale cache if available
-                    return json.loads(row[0])
-                return []
-                
-            items = data.get("items", []) or []
-            out = [
-                {
-                    "title": it.get("title", ""),
-                    "url": it.get("link", ""),
-                    "snippet": it.get("snippet", "")
-                } 
-                for it in items
-            ]
-
-            # Cache the results
-            conn.execute("INSERT OR REPLACE INTO cache(key,value,ts) VALUES(?,?,?)", 
-                        (key, json.dumps(out), now))
-            conn.commit()
+
+    # cache hit?
+    row = conn.execute("SELECT value, ts FROM cache WHERE key=?", (key,)).fetchone()
+    if row:
+        value, ts = row
+        if now - ts < CACHE_TTL_SEC:
+            out = json.loads(value)
+            _mem_put(key, ts, out)
             return out
+
+    def stale() -> List[Dict]:
+        # expired row (if any) is the fallback whenever we can't get fresh results
+        return json.loads(row[0]) if row else []
+
+    # quota check
+    if not _quota_try_consume(conn, 1):
+        return stale()
+
+    params = {
+        "key": GOOGLE_API_KEY, 
+        "cx": cx, 
+        "q": q, 
+        "num": num
+    }
+    if site:
+        params["siteSearch"] = site
+
+    try:
+        r = _SESSION.get(CSE_ENDPOINT, params=params, timeout=15)
+        r.raise_for_status()
+        data = r.json()
+        
+        # Handle API errors
+        if "error" in data:
+            print(f"CSE API Error: {data['error']}")
+            return stale()
             
-        except requests.RequestException as e:
-            print(f"CSE Request Error: {e}")
-            # Return stale cache if available
-            if row:
-                return json.loads(row[0])
-            return []
-    
-    finally:
-        conn.close()
+        items = data.get("items", []) or []
+        out = [
+            {
+                "title": it.get("title", ""),
+                "url": it.get("link", ""),
+                "snippet": it.get("snippet", "")
+            } 
+            for it in items
+        ]
+
+        # Cache the results
+        with conn:
+            conn.execute("""
+                INSERT INTO cache(key, value, ts) VALUES(?, ?, ?)
+                ON CONFLICT(key) DO UPDATE SET value = excluded.value, ts = excluded.ts
+            """, (key, json.dumps(out), now))
+        _mem_put(key, now, out)
+        return out
+        
+    except requests.RequestException as e:
+        print(f"CSE Request Error: {e}")
+        return stale()
+
+# v2 tier-1 sources, in priority order
+TIER1_SITES = (
+    "enr.com",
+    "construction.com",
+    "commercialobserver.com",
+    "bisnow.com",
+    "urbanland.uli.org",
+)
+TIER1_SITE_FILTER = "(" + " OR ".join(f"site:{site}" for site in TIER1_SITES) + ")"
+
+def _tier_rank(result: Dict) -> int:
+    host = urlparse(result["url"]).netloc.lower()
+    for i, site in enumerate(TIER1_SITES):
+        if host == site or host.endswith("." + site):
+            return i
+    return len(TIER1_SITES)
 
 def search_construction_news(query: str, num: int = 5) -> List[Dict]:
     """
     Search for construction/real estate news with v2 source prioritization
     """
-    # Try tier-1 sources first
-    tier1_sites = [
-        "enr.com",
-        "construction.com", 
-        "commercialobserver.com",
-        "bisnow.com",
-        "urbanland.uli.org"
-    ]
-    
-    results = []
-    remaining = num
-    
-    # Search tier-1 sources first
-    for site in tier1_sites:
-        if remaining <= 0:
-            break
-        site_results = cse_search(query, site=site, num=min(remaining, 3))
-        results.extend(site_results)
-        remaining -= len(site_results)
+    # One query covering every tier-1 site (one quota unit instead of five),
+    # then restore the tier ordering; sorted() is stable within a site.
+    tier_results = cse_search(f"{query} {TIER1_SITE_FILTER}", num=num)
+    results = sorted(tier_results, key=_tier_rank)
+    remaining = num - len(results)
     
     # If we need more results, do a general search
     if remaining > 0:
         general_results = cse_search(query, num=remaining)
-        # Filter out duplicates
-        existing_urls = {r["url"] for r in results}
+        # Filter out duplicates (including repeats within the general results)
+        seen_urls = {r["url"] for r in results}
         for result in general_results:
-            if result["url"] not in existing_urls:
-                results.append(result)
-                if len(results) >= num:
-                    break
+            url = result["url"]
+            if url in seen_urls:
+                continue
+            seen_urls.add(url)
+            results.append(result)
+            if len(results) >= num:
+                break
     
     return results[:num]
 
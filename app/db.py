@@ -1,6 +1,10 @@
 import os
+import threading
+from contextlib import contextmanager
+from functools import lru_cache
 from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 
 # Get database URL from environment, with FORCE_SQLITE override
 def _get_database_url():
@@ -24,9 +28,28 @@ def _get_database_url():
 actual_db_url = _get_database_url()
 is_postgres = actual_db_url.startswith('postgresql+psycopg') or actual_db_url.startswith('postgres')
 
+@lru_cache(maxsize=None)
+def get_engine():
+    """The process-wide engine; every module shares this one pool"""
+    if not is_postgres:
+        if actual_db_url in ("sqlite://", "sqlite:///:memory:"):
+            # one shared connection, or each checkout would see an empty database
+            return create_engine(actual_db_url, connect_args={"check_same_thread": False},
+                                 poolclass=StaticPool)
+        return create_engine(actual_db_url, pool_pre_ping=True, pool_size=10, max_overflow=5,
+                             pool_use_lifo=True, connect_args={"check_same_thread": False})
+    # LIFO hands back the most recently used (warmest) connection first
+    return create_engine(actual_db_url, pool_pre_ping=True, pool_size=10, max_overflow=5,
+                         pool_recycle=1800, pool_use_lifo=True, pool_reset_on_return="rollback")
+
 # Create engine with the actual database URL
-engine = create_engine(actual_db_url, pool_pre_ping=True)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+engine = get_engine()
+_session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+def SessionLocal():
+    """New session; the first one in a process makes sure the schema exists"""
+    init_db()
+    return _session_factory()
 
 # PostgreSQL schema
 POSTGRES_SCHEMA_SQL = """
@@ -57,8 +80,8 @@ CREATE TABLE IF NOT EXISTS article_scores (
   importance_multiplier REAL,
   freshness_bonus REAL,
   composite_score REAL,
-  topics TEXT[], -- JSON string
-  geography TEXT[], -- JSON string
+  topics TEXT[],
+  geography TEXT[],
   macro_flag BOOLEAN,
   summary2 TEXT,
   why1 TEXT,
@@ -85,8 +108,20 @@ CREATE TABLE IF NOT EXISTS issue_items (
 
 -- Create indexes for better performance
 CREATE INDEX IF NOT EXISTS idx_articles_published_at ON articles(published_at);
-CREATE INDEX IF NOT EXISTS idx_articles_status ON articles(status);
-CREATE INDEX IF NOT EXISTS idx_article_scores_composite ON article_scores(composite_score);
+-- Only the pipeline statuses are ever filtered on; discarded rows stay out of the index
+DROP INDEX IF EXISTS idx_articles_status;
+CREATE INDEX IF NOT EXISTS idx_articles_status_active ON articles(status)
+  WHERE status IN ('new', 'scored', 'selected');
+-- Top-N ranking (ORDER BY composite_score DESC) answered from the index alone;
+-- it also serves plain composite_score lookups, so the single-column index goes
+DROP INDEX IF EXISTS idx_article_scores_composite;
+CREATE INDEX IF NOT EXISTS idx_scores_rank ON article_scores(composite_score DESC, article_id);
+-- Array containment (topics @> ARRAY['x']) lookups
+CREATE INDEX IF NOT EXISTS idx_scores_topics_gin ON article_scores USING GIN(topics);
+CREATE INDEX IF NOT EXISTS idx_scores_geography_gin ON article_scores USING GIN(geography);
+-- Per-media-type ranking
+DROP INDEX IF EXISTS idx_scores_media_date;
+CREATE INDEX IF NOT EXISTS idx_scores_media_rank ON article_scores(media_type, composite_score DESC);
 """
 
 # SQLite schema (fallback)
@@ -143,30 +178,56 @@ CREATE TABLE IF NOT EXISTS issue_items (
 
 CREATE INDEX IF NOT EXISTS idx_articles_published_at ON articles(published_at);
 CREATE INDEX IF NOT EXISTS idx_articles_status ON articles(status);
-CREATE INDEX IF NOT EXISTS idx_article_scores_composite ON article_scores(composite_score);
+DROP INDEX IF EXISTS idx_article_scores_composite;
+CREATE INDEX IF NOT EXISTS idx_scores_rank ON article_scores(composite_score DESC, article_id);
 """
 
+_inited = False
+
+SCHEMA_SQL = {"postgresql": POSTGRES_SCHEMA_SQL, "sqlite": SQLITE_SCHEMA_SQL}
+# Last object created by POSTGRES_SCHEMA_SQL; move this when appending DDL
+SCHEMA_SENTINEL = "idx_scores_media_rank"
+
+_init_lock = threading.Lock()
+
 def init_db():
-    """Initialize database with schema"""
+    """Initialize database with schema (once per process; SessionLocal calls it)"""
+    global _inited
+    if _inited:
+        return
+    with _init_lock:
+        if not _inited:
+            _init_schema()
+
+def _init_schema():
+    """Run the schema script for this dialect (callers hold _init_lock)"""
+    global _inited
     try:
-        with engine.connect() as conn:
-            if is_postgres:
-                # For PostgreSQL, we can execute the whole script at once
-                conn.execute(text(POSTGRES_SCHEMA_SQL))
-            else:
-                # For SQLite, execute each statement separately
-                statements = SQLITE_SCHEMA_SQL.strip().split(';')
-                for statement in statements:
-                    statement = statement.strip()
-                    if statement:
-                        conn.execute(text(statement))
-            conn.commit()
+        if is_postgres:
+            # For PostgreSQL, we can execute the whole script at once; skip it when
+            # the last object it creates is already there (schema is current)
+            with engine.connect() as conn:
+                if conn.execute(text("SELECT to_regclass(:name)"), {"name": SCHEMA_SENTINEL}).scalar():
+                    _inited = True
+                    return
+                conn.execute(text(SCHEMA_SQL["postgresql"]))
+                conn.commit()
+        else:
+            # For SQLite, hand the whole script to sqlite3's executescript
+            raw = engine.raw_connection()
+            try:
+                raw.driver_connection.executescript(SCHEMA_SQL["sqlite"])
+                raw.commit()
+            finally:
+                raw.close()
+        _inited = True
         print(f"Database initialized successfully ({'PostgreSQL' if is_postgres else 'SQLite'})")
     except Exception as e:
         print(f"Error initializing database: {e}")
         # Don't re-raise if it's just about existing tables/extensions
         if "already exists" not in str(e).lower():
             raise
+        _inited = True
 
 def get_db():
     """Dependency to get database session"""
@@ -176,5 +237,15 @@ def get_db():
     finally:
         db.close()
 
-# Initialize database on import
-init_db()
\ No newline at end of file
+@contextmanager
+def session_scope():
+    """Session for a unit of work: commits on success, rolls back on error"""
+    db = SessionLocal()
+    try:
+        yield db
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
@@ -4,113 +4,125 @@ Enhanced Crawler - Combines RSS feeds with web scraping for high-quality sources
 """
 
 import json
+import logging
 import os
-from typing import List, Dict, Any
+from typing import List
 from .crawler import ingest_run as rss_ingest_run
-from .insight_scraper import InsightScraper
-from .db import SessionLocal
-from sqlalchemy import text
-import uuid
+from .insight_scraper import InsightScraper, ScrapedArticle
+from .db import is_postgres, session_scope
+from sqlalchemy import column, table
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 
+log = logging.getLogger(__name__)
+
+# Optional faster JSON parser
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None
+
+PROFESSIONAL_SEEDS_PATH = 'app/professional_seeds.json'
+
+@lru_cache(maxsize=1)
+def _read_professional_seeds(mtime: float):
+    # mtime is only the cache key: an edited file gets re-read
+    if orjson:
+        with open(PROFESSIONAL_SEEDS_PATH, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(PROFESSIONAL_SEEDS_PATH, 'r') as f:
+        return json.load(f)
+
 def load_professional_seeds():
     """Load professional RSS feeds and scraper sources"""
     try:
-        with open('app/professional_seeds.json', 'r') as f:
-            return json.load(f)
+        return _read_professional_seeds(os.path.getmtime(PROFESSIONAL_SEEDS_PATH))
     except FileNotFoundError:
         print("⚠️  Professional seeds file not found, using default seeds")
         return None
 
-def save_scraped_articles(articles: List[Dict[str, Any]]):
+_articles = table(
+    "articles",
+    column("id"), column("title"), column("url"), column("summary_raw"), column("content"),
+    column("published_at"), column("fetched_at"), column("lang"), column("source"), column("status"),
+)
+
+# Duplicates (already stored, or repeated in a batch) are left to the UNIQUE(url)
+# constraint instead of a SELECT probe. A Core insert (rather than text()) lets
+# SQLAlchemy's insertmanyvalues send the batch as multi-row VALUES with RETURNING.
+_INSERT_ARTICLE = (
+    (pg_insert if is_postgres else sqlite_insert)(_articles)
+    .on_conflict_do_nothing(index_elements=["url"])
+    .returning(_articles.c.id)
+)
+
+def save_scraped_articles(articles: List[ScrapedArticle]):
     """Save scraped articles to database"""
     if not articles:
         return 0
     
-    saved_count = 0
-    db = SessionLocal()
+    # one timestamp for the whole batch, used when a scraper left fetched_at unset
+    now = datetime.now(timezone.utc)
+    
+    # One urandom call for the whole batch; 32-char hex ids match the SQLite
+    # default and are valid UUID input on Postgres
+    blob = os.urandom(16 * len(articles))
+    rows = [{
+        "id": blob[i * 16:(i + 1) * 16].hex(),
+        "title": article.title,
+        "url": article.url,
+        "summary_raw": article.summary,
+        "content": article.summary,  # Use summary as content for now
+        "published_at": article.published_at or None,  # scrapers use "" for no date
+        "fetched_at": article.fetched_at or now,
+        "lang": "en",
+        "source": article.source,
+        "status": "new"
+    } for i, article in enumerate(articles)]
     
     try:
-        for article in articles:
+        with session_scope() as db:
+            # one batched INSERT; RETURNING yields a row per article actually inserted
+            saved_count = len(db.execute(_INSERT_ARTICLE, rows).all())
+    except Exception as e:
+        # The batch is all-or-nothing; retry row by row so a bad row only costs itself
+        log.warning(f"⚠️  Batch insert failed ({e}), retrying articles one at a time")
+        saved_count = 0
+        for row in rows:
             try:
-                # Check if article already exists
-                existing = db.execute(
-                    text("SELECT id FROM articles WHERE url = :url"),
-                    {"url": article['url']}
-                ).fetchone()
-                
-                if existing:
-                    continue
-                
-                # Insert new article
-                article_id = str(uuid.uuid4())
-                
-                db.execute(text("""
-                    INSERT INTO articles (
-                        id, title, url, summary_raw, content, published_at, 
-                        fetched_at, lang, source, status
-                    ) VALUES (
-                        :id, :title, :url, :summary, :content, :published_at,
-                        :fetched_at, :lang, :source, 'new'
-                    )
-                """), {
-                    "id": article_id,
-                    "title": article['title'],
-                    "url": article['url'],
-                    "summary": article['summary'],
-                    "content": article['summary'],  # Use summary as content for now
-                    "published_at": article['published_at'],
-                    "fetched_at": article['fetched_at'],
-                    "lang": "en",
-                    "source": article['source']
-                })
-                
-                saved_count += 1
-                print(f"   ✅ Saved: {article['title'][:50]}...")
-                
+                with session_scope() as db:
+                    saved_count += len(db.execute(_INSERT_ARTICLE, row).all())
             except Exception as e:
-                print(f"   ⚠️  Error saving article: {e}")
-                continue
-        
-        db.commit()
-        print(f"🎉 Saved {saved_count} new articles from scraping")
-        
-    except Exception as e:
-        print(f"❌ Error saving articles: {e}")
-        db.rollback()
-    finally:
-        db.close()
+                log.error(f"❌ Error saving article {row['url']}: {e}")
     
+    log.info(f"🎉 Saved {saved_count} new articles from scraping")
     return saved_count
 
-def enhanced_ingest_run(limit: int = 100):
-    """Enhanced ingestion combining RSS feeds and web scraping"""
-    print("🚀 Starting Enhanced Ingest Run...")
-    print(f"📊 Target: {limit} articles")
-    
-    total_ingested = 0
-    
-    # Load professional sources
-    seeds = load_professional_seeds()
-    
-    # Phase 1: Scrape high-quality insight sources
-    print("\n📡 Phase 1: Scraping High-Quality Insight Sources")
-    scraper = InsightScraper()
-    
+def _fetch_insights(limit: int) -> List[ScrapedArticle]:
+    """Phase 1 network half: scrape high-quality insight sources (no DB access)"""
     try:
-        scraped_articles = scraper.scrape_all_insights(limit=limit // 2)
-        scraped_count = save_scraped_articles(scraped_articles)
-        total_ingested += scraped_count
-        print(f"✅ Scraped {scraped_count} articles from insight sources")
+        with InsightScraper() as scraper:
+            return scraper.scrape_all_insights(limit=limit // 2)
     except Exception as e:
         print(f"❌ Error in scraping phase: {e}")
-    
-    # Phase 2: Use professional RSS feeds
+        return []
+
+def _phase_scrape(scraped_articles: List[ScrapedArticle]) -> int:
+    """Phase 1: Save the scraped insight articles"""
+    print("\n📡 Phase 1: Scraping High-Quality Insight Sources")
+    scraped_count = save_scraped_articles(scraped_articles)
+    print(f"✅ Scraped {scraped_count} articles from insight sources")
+    return scraped_count
+
+def _phase_rss(seeds, limit: int) -> int:
+    """Phase 2: Use professional RSS feeds"""
     print("\n📡 Phase 2: Professional RSS Feeds")
     
+    professional_feeds = []
     if seeds and 'professional_sources' in seeds:
-        # Update the seeds.json with professional sources
-        professional_feeds = []
         for category, data in seeds['professional_sources'].items():
             for feed in data['feeds']:
                 professional_feeds.append({
@@ -119,73 +131,81 @@ def enhanced_ingest_run(limit: int = 100):
                     "category": category,
                     "quality_score": feed.get('quality_score', 80)
                 })
-        
-        # Save professional feeds to seeds.json temporarily
-        try:
-            with open('app/seeds.json', 'r') as f:
-                original_seeds = json.load(f)
-            
-            # Add professional feeds to existing seeds
-            for feed in professional_feeds:
-                original_seeds['feeds'].append(feed)
-            
-            with open('app/seeds.json', 'w') as f:
-                json.dump(original_seeds, f, indent=2)
-            
-            print(f"✅ Added {len(professional_feeds)} professional RSS feeds")
-            
-        except Exception as e:
-            print(f"⚠️  Error updating seeds: {e}")
+        print(f"✅ Added {len(professional_feeds)} professional RSS feeds")
     
     # Run RSS crawler
     try:
         print("🔄 Running RSS crawler...")
-        rss_result = rss_ingest_run(limit=limit // 2)
-        if isinstance(rss_result, dict) and 'ingested' in rss_result:
-            rss_count = rss_result['ingested']
+        rss_result = rss_ingest_run(limit=limit // 2, extra_feeds=professional_feeds)
+        # ingest_run returns the inserted count; run() wraps it in a dict
+        if isinstance(rss_result, dict):
+            rss_count = int(rss_result.get('ingested') or 0)
         else:
-            rss_count = 0
+            rss_count = int(rss_result or 0)
         
-        total_ingested += rss_count
         print(f"✅ RSS crawler ingested {rss_count} articles")
+        return rss_count
         
     except Exception as e:
         print(f"❌ Error in RSS phase: {e}")
-    
-    # Phase 3: Google Search for high-opportunity content
+        return 0
+
+GOOGLE_PHASE_CAP = 1000
+
+def _phase_google(seeds, limit: int) -> int:
+    """Phase 3: Google Search for high-opportunity content"""
     print("\n📡 Phase 3: Google Search for High-Opportunity Content")
     
-    if seeds and 'google_search_queries' in seeds:
-        try:
-            from .crawler import crawl_google_searches
-            
-            # Create a temporary database session for Google searches
-            db = SessionLocal()
-            
-            # Mock the parameters needed for Google search
-            inserted_counter = [0]
-            attempts_counter = [0]
-            domain_counts = {}
-            cap = 1000
-            now_utc = datetime.now(timezone.utc)
-            
+    if not (seeds and 'google_search_queries' in seeds):
+        return 0
+    
+    try:
+        from .crawler import crawl_google_searches
+        
+        # Counter scaffolding crawl_google_searches expects
+        inserted_counter = [0]
+        attempts_counter = [0]
+        domain_counts = {}
+        
+        # Temporary session for Google searches; committed when the phase ends
+        with session_scope() as db:
             google_count = crawl_google_searches(
                 limit=limit // 4,  # Use 1/4 of limit for Google searches
                 db=db,
                 inserted_counter=inserted_counter,
                 attempts_counter=attempts_counter,
                 domain_counts=domain_counts,
-                cap=cap,
-                now_utc=now_utc
+                cap=GOOGLE_PHASE_CAP,
+                now_utc=datetime.now(timezone.utc)
             )
-            
-            total_ingested += google_count
-            print(f"✅ Google searches found {google_count} articles")
-            
-            db.close()
-            
-        except Exception as e:
-            print(f"❌ Error in Google search phase: {e}")
+        
+        print(f"✅ Google searches found {google_count} articles")
+        return google_count
+        
+    except Exception as e:
+        print(f"❌ Error in Google search phase: {e}")
+        return 0
+
+def enhanced_ingest_run(limit: int = 100):
+    """Enhanced ingestion combining RSS feeds and web scraping"""
+    print("🚀 Starting Enhanced Ingest Run...")
+    print(f"📊 Target: {limit} articles")
+    
+    # Load professional sources
+    seeds = load_professional_seeds()
+    
+    # DB writes stay sequential: ingest_run holds one write transaction for the
+    # whole RSS crawl, and the Google phase inserts the same CSE URLs. Only the
+    # insight-page fetches (pure network) overlap with the RSS phase.
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        scrape_future = pool.submit(_fetch_insights, limit)
+        rss_count = _phase_rss(seeds, limit)
+        scraped_count = _phase_scrape(scrape_future.result())
+    google_count = _phase_google(seeds, limit)
+    
+    phases = {"scraping": scraped_count, "rss": rss_count, "google": google_count}
+    
+    total_ingested = sum(phases.values())
     
     print(f"\n🎉 Enhanced Ingest Complete!")
     print(f"📊 Total articles ingested: {total_ingested}")
@@ -193,11 +213,7 @@ def enhanced_ingest_run(limit: int = 100):
     return {
         "ok": True,
         "total_ingested": total_ingested,
-        "phases": {
-            "scraping": scraped_count if 'scraped_count' in locals() else 0,
-            "rss": rss_count if 'rss_count' in locals() else 0,
-            "google": google_count if 'google_count' in locals() else 0
-        }
+        "phases": phases
     }
 
 def main():
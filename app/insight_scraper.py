@@ -4,344 +4,403 @@ Insight Scraper - Convert high-quality non-RSS sources into feed data
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
+import soupsieve as sv
 from urllib.parse import urljoin, urlparse
 import json
+from dataclasses import asdict, dataclass
 from datetime import datetime, timezone
-from typing import List, Dict, Any
-import time
+from typing import List, Optional
+import logging
 import re
+import hashlib
+import os
+import pathlib
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 
-class InsightScraper:
-    def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        })
+log = logging.getLogger(__name__)
+
+# Optional faster JSON serializer
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None
+
+# Prefer the C-based lxml parser; fall back to the stdlib parser if it's missing
+try:
+    import lxml  # type: ignore  # noqa: F401
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
+# Only advertise br when urllib3 can decode it (brotli or brotlicffi installed)
+try:
+    import brotli  # type: ignore  # noqa: F401
+    ACCEPT_ENCODING = "gzip, deflate, br"
+except ImportError:
+    try:
+        import brotlicffi  # type: ignore  # noqa: F401
+        ACCEPT_ENCODING = "gzip, deflate, br"
+    except ImportError:
+        ACCEPT_ENCODING = "gzip, deflate"
+
+_HEADING_TAGS = ['h1', 'h2', 'h3', 'h4', 'h5', 'h6']
+_SUMMARY_TAGS = ['p', '.summary', '.description', '.excerpt']
+_STRIP_TAGS = ['script', 'style', 'svg', 'noscript', 'iframe']
+
+# ISO (2024-01-31) or US (1/31/2024, 01/31/2024) dates
+_DATE_RE = re.compile(r'\d{4}-\d{2}-\d{2}|\d{1,2}/\d{1,2}/\d{4}')
+
+@dataclass(slots=True)
+class ScrapedArticle:
+    """One listing entry from an insight source"""
+    title: str
+    url: str
+    summary: str
+    source: str
+    published_at: str
+    fetched_at: str
+    content_type: str
+    quality_score: int
+
+@dataclass(frozen=True)
+class SourceSpec:
+    """How to scrape one insight source's listing page"""
+    label: str             # short name for log lines
+    source: str            # stored as the article source
+    url: str
+    selectors: tuple       # article container selectors, tried in order
+    content_type: str
+    quality_score: int
+    extract_date: bool = False  # parse a date from the card; otherwise stamp fetch time
+
+JPM_INSIGHTS = SourceSpec(
+    label='JPM',
+    source='J.P. Morgan Asset Management',
+    url="https://am.jpmorgan.com/us/en/asset-management/adv/insights/",
+    selectors=('.insight-item', '.article-item', '.post-item', '[data-testid*="insight"]', '.card', 'article'),
+    content_type='insight',
+    quality_score=95,  # High quality source
+    extract_date=True
+)
+CRE_ANALYST = SourceSpec(
+    label='CRE Analyst',
+    source='CRE Analyst',
+    url="https://www.creanalyst.com/insights/",
+    selectors=('.post', '.article', '.insight-item', '.blog-post', 'article', '.entry'),
+    content_type='insight',
+    quality_score=90
+)
+CRE_INSIGHT_JOURNAL = SourceSpec(
+    label='CRE Insight Journal',
+    source='CRE Insight Journal',
+    url="https://creinsightjournal.com/",
+    selectors=('.post', '.article', '.journal-entry', 'article', '.content-item'),
+    content_type='insight',
+    quality_score=88
+)
+NAR_CRE_INSIGHTS = SourceSpec(
+    label='NAR',
+    source='NAR Commercial Real Estate',
+    url="https://www.nar.realtor/commercial-real-estate-market-insights",
+    selectors=('.article', '.post', '.insight-item', '.market-insight', 'article', '.content-item'),
+    content_type='market_insight',
+    quality_score=92
+)
+
+SOURCES = (JPM_INSIGHTS, CRE_ANALYST, CRE_INSIGHT_JOURNAL, NAR_CRE_INSIGHTS)
+
+# Container selectors compiled once at import (bs4 installs soupsieve)
+_COMPILED_SELECTORS = {sel: sv.compile(sel) for spec in SOURCES for sel in spec.selectors}
+
+def _first_match(soup, selectors) -> list:
+    """Hits for the first selector that matches anything; later ones never run"""
+    return next((hits for selector in selectors if (hits := _COMPILED_SELECTORS[selector].select(soup))), [])
+
+def _make_soup(content: bytes, encoding) -> BeautifulSoup:
+    """Parse a fetched listing page; the one place the parser is chosen"""
+    soup = BeautifulSoup(content, HTML_PARSER, from_encoding=encoding)
+    # Drop subtrees extraction never reads so the selector walks stay small
+    for tag in soup(_STRIP_TAGS):
+        tag.decompose()
+    return soup
+
+def _extract_articles(content: bytes, encoding, spec: SourceSpec, limit: Optional[int], now_iso: str) -> List[ScrapedArticle]:
+    """Parse a listing page and pull out up to `limit` articles (all when None)"""
+    url = spec.url
+    soup = _make_soup(content, encoding)
+    articles = []
+    seen = set()  # nested/overlapping cards often link the same article
     
-    def scrape_jpmorgan_insights(self, limit: int = 20) -> List[Dict[str, Any]]:
-        """Scrape J.P. Morgan Asset Management Insights"""
-        print("🔍 Scraping J.P. Morgan Insights...")
-        articles = []
-        
+    # Look for article containers
+    found_articles = _first_match(soup, spec.selectors)
+    
+    for article_elem in found_articles[:limit]:
         try:
-            # Main insights page
-            url = "https://am.jpmorgan.com/us/en/asset-management/adv/insights/"
-            response = self.session.get(url, timeout=30)
-            response.raise_for_status()
+            # Extract title
+            title_elem = article_elem.find(_HEADING_TAGS)
+            if not title_elem:
+                title_elem = article_elem.find('a')
+            title = title_elem.get_text(strip=True) if title_elem else "Untitled"
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            # Extract link
+            link_elem = article_elem.find('a')
+            if link_elem and link_elem.get('href'):
+                link = urljoin(url, link_elem['href'])
+            else:
+                continue
+            if link in seen:
+                continue
+            seen.add(link)
             
-            # Look for article containers
-            article_selectors = [
-                '.insight-item',
-                '.article-item', 
-                '.post-item',
-                '[data-testid*="insight"]',
-                '.card',
-                'article'
-            ]
+            # Extract summary/description
+            summary_elem = article_elem.find(_SUMMARY_TAGS)
+            summary = summary_elem.get_text(strip=True) if summary_elem else ""
             
-            found_articles = []
-            for selector in article_selectors:
-                found_articles.extend(soup.select(selector))
-                if found_articles:
-                    break
+            # Extract date (look for various date patterns)
+            if spec.extract_date:
+                date_match = _DATE_RE.search(article_elem.get_text(' ', strip=True))
+                published_at = date_match.group(0) if date_match else ""
+            else:
+                published_at = now_iso
             
-            for article_elem in found_articles[:limit]:
-                try:
-                    # Extract title
-                    title_elem = article_elem.find(['h1', 'h2', 'h3', 'h4', 'h5', 'h6'])
-                    if not title_elem:
-                        title_elem = article_elem.find('a')
-                    title = title_elem.get_text(strip=True) if title_elem else "Untitled"
-                    
-                    # Extract link
-                    link_elem = article_elem.find('a')
-                    if link_elem and link_elem.get('href'):
-                        link = urljoin(url, link_elem['href'])
-                    else:
-                        continue
-                    
-                    # Extract summary/description
-                    summary_elem = article_elem.find(['p', '.summary', '.description', '.excerpt'])
-                    summary = summary_elem.get_text(strip=True) if summary_elem else ""
-                    
-                    # Extract date (look for various date patterns)
-                    date_text = ""
-                    for elem in article_elem.find_all(text=True):
-                        if re.search(r'\d{4}-\d{2}-\d{2}|\d{2}/\d{2}/\d{4}|\d{1,2}/\d{1,2}/\d{4}', elem):
-                            date_text = elem.strip()
-                            break
-                    
-                    articles.append({
-                        'title': title,
-                        'url': link,
-                        'summary': summary,
-                        'source': 'J.P. Morgan Asset Management',
-                        'published_at': date_text,
-                        'fetched_at': datetime.now(timezone.utc).isoformat(),
-                        'content_type': 'insight',
-                        'quality_score': 95  # High quality source
-                    })
-                    
-                except Exception as e:
-                    print(f"   ⚠️  Error processing JPM article: {e}")
-                    continue
-            
-            print(f"   ✅ Found {len(articles)} JPM articles")
+            articles.append(ScrapedArticle(
+                title=title,
+                url=link,
+                summary=summary,
+                source=spec.source,
+                published_at=published_at,
+                fetched_at=now_iso,
+                content_type=spec.content_type,
+                quality_score=spec.quality_score
+            ))
             
         except Exception as e:
-            print(f"   ❌ Error scraping JPM insights: {e}")
-        
-        return articles
+            log.warning(f"⚠️  Error processing {spec.label} article: {e}")
+            continue
     
-    def scrape_cre_analyst(self, limit: int = 20) -> List[Dict[str, Any]]:
-        """Scrape CRE Analyst insights"""
-        print("🔍 Scraping CRE Analyst...")
+    return articles
+
+# Minimum spacing between requests to the same host, in seconds
+HOST_MIN_INTERVAL = 1.0
+
+# Conditional-GET validators plus the articles last extracted from each listing
+# page, so an unchanged page costs a 304 round-trip and no parse
+CACHE_DIR = pathlib.Path(os.environ.get("INSIGHT_CACHE_DIR", ".insight_store"))
+CACHE_PATH = CACHE_DIR / "insight_cache.sqlite"
+
+# sqlite3 connections can't cross threads; each scraper thread keeps its own
+_tls = threading.local()
+
+def _cache_db() -> sqlite3.Connection:
+    conn = getattr(_tls, "conn", None)
+    if conn is None:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(CACHE_PATH)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("""
+        CREATE TABLE IF NOT EXISTS pages (
+          url TEXT PRIMARY KEY,
+          etag TEXT,
+          last_modified TEXT,
+          body_hash BLOB,
+          articles TEXT NOT NULL
+        )""")
+        # stores created before body hashing was added
+        if "body_hash" not in {row[1] for row in conn.execute("PRAGMA table_info(pages)")}:
+            conn.execute("ALTER TABLE pages ADD COLUMN body_hash BLOB")
+        _tls.conn = conn
+    return conn
+
+def _dump_articles(articles: List[ScrapedArticle]):
+    # orjson serializes (slotted) dataclasses natively, no asdict() pass needed
+    if orjson:
+        return orjson.dumps(articles)
+    return json.dumps([asdict(a) for a in articles])
+
+def _load_articles(raw) -> List[ScrapedArticle]:
+    rows = orjson.loads(raw) if orjson else json.loads(raw)
+    return [ScrapedArticle(**a) for a in rows]
+
+def _body_hash(content: bytes) -> bytes:
+    # BLAKE2 is C-implemented and cheaper than sha256; 16 bytes is plenty here
+    return hashlib.blake2b(content, digest_size=16).digest()
+
+def _cached_page(url: str):
+    """(etag, last_modified, body_hash, articles) from the last 200 for this url, or None"""
+    try:
+        row = _cache_db().execute(
+            "SELECT etag, last_modified, body_hash, articles FROM pages WHERE url = ?", (url,)
+        ).fetchone()
+    except sqlite3.Error as e:
+        log.warning(f"⚠️  Insight cache read failed for {url}: {e}")
+        return None
+    if not row:
+        return None
+    etag, last_modified, body_hash, articles = row
+    return etag, last_modified, body_hash, _load_articles(articles)
+
+def _store_page(url: str, etag, last_modified, body_hash: bytes, articles: List[ScrapedArticle]):
+    try:
+        conn = _cache_db()
+        conn.execute("""
+            INSERT INTO pages (url, etag, last_modified, body_hash, articles) VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT(url) DO UPDATE SET
+              etag = excluded.etag,
+              last_modified = excluded.last_modified,
+              body_hash = excluded.body_hash,
+              articles = excluded.articles
+        """, (url, etag, last_modified, body_hash, _dump_articles(articles)))
+        conn.commit()
+    except sqlite3.Error as e:
+        log.warning(f"⚠️  Insight cache write failed for {url}: {e}")
+
+class InsightScraper:
+    def __init__(self):
+        # Politeness is per host: host -> monotonic time its next request may start
+        self._host_next_slot = {}
+        self._host_lock = threading.Lock()
+        self.session = requests.Session()
+        # Keep-alive pool sized for the concurrent source fetches, with a short
+        # backoff retry on throttling and transient upstream errors
+        adapter = HTTPAdapter(
+            pool_connections=8,
+            pool_maxsize=8,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.session.headers.update({
+            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+            'Accept-Encoding': ACCEPT_ENCODING
+        })
+    
+    def _throttle(self, url: str):
+        """Space requests to the same host HOST_MIN_INTERVAL apart; other hosts don't wait"""
+        host = urlparse(url).netloc
+        with self._host_lock:
+            now = time.monotonic()
+            slot = max(now, self._host_next_slot.get(host, 0.0))
+            self._host_next_slot[host] = slot + HOST_MIN_INTERVAL
+        if slot > now:
+            time.sleep(slot - now)
+    
+    def close(self):
+        """Release the pooled connections"""
+        self.session.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+    
+    def _scrape_source(self, spec: SourceSpec, limit: int) -> List[ScrapedArticle]:
+        """Fetch one source's listing page and extract up to `limit` articles"""
+        log.info(f"🔍 Scraping {spec.source}...")
         articles = []
         
         try:
-            # Main insights page
-            url = "https://www.creanalyst.com/insights/"
-            response = self.session.get(url, timeout=30)
+            cached = _cached_page(spec.url)
+            headers = {}
+            if cached:
+                etag, last_modified, _, _ = cached
+                if etag:
+                    headers['If-None-Match'] = etag
+                if last_modified:
+                    headers['If-Modified-Since'] = last_modified
+            
+            self._throttle(spec.url)
+            response = self.session.get(spec.url, timeout=30, headers=headers)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            if response.status_code == 304 and cached:
+                articles = cached[3][:limit]
+                log.info(f"♻️  {spec.label} unchanged, reusing {len(articles)} cached articles")
+                return articles
             
-            # Look for article containers
-            article_selectors = [
-                '.post',
-                '.article',
-                '.insight-item',
-                '.blog-post',
-                'article',
-                '.entry'
-            ]
+            # Servers without validators often still send byte-identical pages
+            body_hash = _body_hash(response.content)
+            if cached and cached[2] == body_hash:
+                articles = cached[3]
+                log.info(f"♻️  {spec.label} body unchanged, reusing {len(articles)} cached articles")
+            else:
+                # Extract everything: the page cache must serve later, larger limits
+                now_iso = datetime.now(timezone.utc).isoformat()
+                articles = _extract_articles(response.content, response.encoding, spec, None, now_iso)
             
-            found_articles = []
-            for selector in article_selectors:
-                found_articles.extend(soup.select(selector))
-                if found_articles:
-                    break
+            _store_page(spec.url, response.headers.get('ETag'), response.headers.get('Last-Modified'),
+                        body_hash, articles)
+            articles = articles[:limit]
             
-            for article_elem in found_articles[:limit]:
-                try:
-                    # Extract title
-                    title_elem = article_elem.find(['h1', 'h2', 'h3', 'h4', 'h5', 'h6'])
-                    if not title_elem:
-                        title_elem = article_elem.find('a')
-                    title = title_elem.get_text(strip=True) if title_elem else "Untitled"
-                    
-                    # Extract link
-                    link_elem = article_elem.find('a')
-                    if link_elem and link_elem.get('href'):
-                        link = urljoin(url, link_elem['href'])
-                    else:
-                        continue
-                    
-                    # Extract summary
-                    summary_elem = article_elem.find(['p', '.summary', '.description', '.excerpt'])
-                    summary = summary_elem.get_text(strip=True) if summary_elem else ""
-                    
-                    articles.append({
-                        'title': title,
-                        'url': link,
-                        'summary': summary,
-                        'source': 'CRE Analyst',
-                        'published_at': datetime.now(timezone.utc).isoformat(),
-                        'fetched_at': datetime.now(timezone.utc).isoformat(),
-                        'content_type': 'insight',
-                        'quality_score': 90
-                    })
-                    
-                except Exception as e:
-                    print(f"   ⚠️  Error processing CRE Analyst article: {e}")
-                    continue
-            
-            print(f"   ✅ Found {len(articles)} CRE Analyst articles")
+            log.info(f"✅ Found {len(articles)} {spec.label} articles")
             
         except Exception as e:
-            print(f"   ❌ Error scraping CRE Analyst: {e}")
+            log.error(f"❌ Error scraping {spec.source}: {e}")
         
         return articles
     
-    def scrape_cre_insight_journal(self, limit: int = 20) -> List[Dict[str, Any]]:
+    def scrape_jpmorgan_insights(self, limit: int = 20) -> List[ScrapedArticle]:
+        """Scrape J.P. Morgan Asset Management Insights"""
+        return self._scrape_source(JPM_INSIGHTS, limit)
+    
+    def scrape_cre_analyst(self, limit: int = 20) -> List[ScrapedArticle]:
+        """Scrape CRE Analyst insights"""
+        return self._scrape_source(CRE_ANALYST, limit)
+    
+    def scrape_cre_insight_journal(self, limit: int = 20) -> List[ScrapedArticle]:
         """Scrape CRE Insight Journal"""
-        print("🔍 Scraping CRE Insight Journal...")
-        articles = []
-        
-        try:
-            url = "https://creinsightjournal.com/"
-            response = self.session.get(url, timeout=30)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Look for article containers
-            article_selectors = [
-                '.post',
-                '.article',
-                '.journal-entry',
-                'article',
-                '.content-item'
-            ]
-            
-            found_articles = []
-            for selector in article_selectors:
-                found_articles.extend(soup.select(selector))
-                if found_articles:
-                    break
-            
-            for article_elem in found_articles[:limit]:
-                try:
-                    # Extract title
-                    title_elem = article_elem.find(['h1', 'h2', 'h3', 'h4', 'h5', 'h6'])
-                    if not title_elem:
-                        title_elem = article_elem.find('a')
-                    title = title_elem.get_text(strip=True) if title_elem else "Untitled"
-                    
-                    # Extract link
-                    link_elem = article_elem.find('a')
-                    if link_elem and link_elem.get('href'):
-                        link = urljoin(url, link_elem['href'])
-                    else:
-                        continue
-                    
-                    # Extract summary
-                    summary_elem = article_elem.find(['p', '.summary', '.description', '.excerpt'])
-                    summary = summary_elem.get_text(strip=True) if summary_elem else ""
-                    
-                    articles.append({
-                        'title': title,
-                        'url': link,
-                        'summary': summary,
-                        'source': 'CRE Insight Journal',
-                        'published_at': datetime.now(timezone.utc).isoformat(),
-                        'fetched_at': datetime.now(timezone.utc).isoformat(),
-                        'content_type': 'insight',
-                        'quality_score': 88
-                    })
-                    
-                except Exception as e:
-                    print(f"   ⚠️  Error processing CRE Insight Journal article: {e}")
-                    continue
-            
-            print(f"   ✅ Found {len(articles)} CRE Insight Journal articles")
-            
-        except Exception as e:
-            print(f"   ❌ Error scraping CRE Insight Journal: {e}")
-        
-        return articles
+        return self._scrape_source(CRE_INSIGHT_JOURNAL, limit)
     
-    def scrape_nar_cre_insights(self, limit: int = 20) -> List[Dict[str, Any]]:
+    def scrape_nar_cre_insights(self, limit: int = 20) -> List[ScrapedArticle]:
         """Scrape NAR Commercial Real Estate Insights"""
-        print("🔍 Scraping NAR CRE Insights...")
-        articles = []
-        
-        try:
-            url = "https://www.nar.realtor/commercial-real-estate-market-insights"
-            response = self.session.get(url, timeout=30)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Look for article containers
-            article_selectors = [
-                '.article',
-                '.post',
-                '.insight-item',
-                '.market-insight',
-                'article',
-                '.content-item'
-            ]
-            
-            found_articles = []
-            for selector in article_selectors:
-                found_articles.extend(soup.select(selector))
-                if found_articles:
-                    break
-            
-            for article_elem in found_articles[:limit]:
-                try:
-                    # Extract title
-                    title_elem = article_elem.find(['h1', 'h2', 'h3', 'h4', 'h5', 'h6'])
-                    if not title_elem:
-                        title_elem = article_elem.find('a')
-                    title = title_elem.get_text(strip=True) if title_elem else "Untitled"
-                    
-                    # Extract link
-                    link_elem = article_elem.find('a')
-                    if link_elem and link_elem.get('href'):
-                        link = urljoin(url, link_elem['href'])
-                    else:
-                        continue
-                    
-                    # Extract summary
-                    summary_elem = article_elem.find(['p', '.summary', '.description', '.excerpt'])
-                    summary = summary_elem.get_text(strip=True) if summary_elem else ""
-                    
-                    articles.append({
-                        'title': title,
-                        'url': link,
-                        'summary': summary,
-                        'source': 'NAR Commercial Real Estate',
-                        'published_at': datetime.now(timezone.utc).isoformat(),
-                        'fetched_at': datetime.now(timezone.utc).isoformat(),
-                        'content_type': 'market_insight',
-                        'quality_score': 92
-                    })
-                    
-                except Exception as e:
-                    print(f"   ⚠️  Error processing NAR article: {e}")
-                    continue
-            
-            print(f"   ✅ Found {len(articles)} NAR articles")
-            
-        except Exception as e:
-            print(f"   ❌ Error scraping NAR CRE insights: {e}")
-        
-        return articles
+        return self._scrape_source(NAR_CRE_INSIGHTS, limit)
     
-    def scrape_all_insights(self, limit: int = 50) -> List[Dict[str, Any]]:
+    def scrape_all_insights(self, limit: int = 50) -> List[ScrapedArticle]:
         """Scrape all insight sources"""
-        print("🚀 Starting insight scraping from high-quality sources...")
+        log.info("🚀 Starting insight scraping from high-quality sources...")
         
         all_articles = []
         
-        # Add delays between requests to be respectful
-        sources = [
-            self.scrape_jpmorgan_insights,
-            self.scrape_cre_analyst,
-            self.scrape_cre_insight_journal,
-            self.scrape_nar_cre_insights
-        ]
+        per_source = limit // len(SOURCES)
         
-        for source_func in sources:
-            try:
-                articles = source_func(limit // len(sources))
-                all_articles.extend(articles)
-                time.sleep(2)  # Be respectful to servers
-            except Exception as e:
-                print(f"❌ Error with source: {e}")
-                continue
+        # Each source is a different host, so fetch them side by side; there's
+        # only one request per host, so no inter-request delay is needed
+        with ThreadPoolExecutor(max_workers=len(SOURCES)) as pool:
+            futures = [pool.submit(self._scrape_source, spec, per_source) for spec in SOURCES]
+            seen_urls = set()
+            for future in futures:
+                try:
+                    for article in future.result():
+                        if article.url not in seen_urls:
+                            seen_urls.add(article.url)
+                            all_articles.append(article)
+                except Exception as e:
+                    log.error(f"❌ Error with source: {e}")
+                    continue
         
-        print(f"🎉 Total insights scraped: {len(all_articles)}")
+        log.info(f"🎉 Total insights scraped: {len(all_articles)}")
         return all_articles
 
 def main():
     """Test the insight scraper"""
-    scraper = InsightScraper()
-    articles = scraper.scrape_all_insights(limit=20)
+    logging.basicConfig(level=logging.INFO)
+    with InsightScraper() as scraper:
+        articles = scraper.scrape_all_insights(limit=20)
     
     print(f"\n📊 Scraping Results:")
     print(f"Total articles: {len(articles)}")
     
     for i, article in enumerate(articles[:5]):
-        print(f"\n{i+1}. {article['title'][:60]}...")
-        print(f"   Source: {article['source']}")
-        print(f"   Quality Score: {article['quality_score']}")
-        print(f"   URL: {article['url']}")
+        print(f"\n{i+1}. {article.title[:60]}...")
+        print(f"   Source: {article.source}")
+        print(f"   Quality Score: {article.quality_score}")
+        print(f"   URL: {article.url}")
 
 if __name__ == "__main__":
     main()
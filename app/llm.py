@@ -1,9 +1,18 @@
 # app/llm.py
+import hashlib
 import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Iterator
 from openai import OpenAI
-from .config import OPENAI_API_KEY
+from .config import OPENAI_API_KEY, LLM_SCORING_BASE_URL, LLM_SCORING_MODEL, LLM_SYNTHESIS_MODEL
 
 CLIENT = OpenAI(api_key=OPENAI_API_KEY)
+# Scoring may point at a self-hosted OpenAI-compatible endpoint; the static
+# SYSTEM prompt below is then the shared prefix its prefix cache reuses
+SCORING_CLIENT = OpenAI(api_key=OPENAI_API_KEY, base_url=LLM_SCORING_BASE_URL) if LLM_SCORING_BASE_URL else CLIENT
 
 SYSTEM = """
 You score news articles for a weekly newsletter about architecture/development and building tech.
@@ -21,11 +30,13 @@ def score_article_with_llm(title: str, content: str, published_at=None, fetched_
     snippet = (content or "")[:4000]
     user = f"Title: {title}\n\nContent:\n{snippet}"
 
-    rsp = CLIENT.chat.completions.create(
-        model="gpt-4.1-mini",
+    rsp = SCORING_CLIENT.chat.completions.create(
+        model=LLM_SCORING_MODEL,
         messages=[{"role": "system", "content": SYSTEM},
                   {"role": "user", "content": user}],
         temperature=0.2,
+        # JSON mode: the reply is always a parseable object, no fences or prose
+        response_format={"type": "json_object"},
     )
     text = (rsp.choices[0].message.content or "").strip()
 
@@ -52,15 +63,110 @@ def score_article_with_llm(title: str, content: str, published_at=None, fetched_
 
     return data
 
-def call_llm(prompt: str, max_tokens: int = 1000, temperature: float = 0.3) -> str:
-    """Generic LLM call function for synthesis tasks"""
+# Prompt-cache telemetry for call_llm: OpenAI caches identical prompt prefixes
+# automatically, so a stable system message should show up as cached_tokens
+LLM_USAGE = {"calls": 0, "prompt_tokens": 0, "cached_tokens": 0}
+_usage_lock = threading.Lock()
+
+def _record_usage(usage) -> None:
+    if usage is None:
+        return
+    details = getattr(usage, "prompt_tokens_details", None)
+    cached = getattr(details, "cached_tokens", 0) or 0
+    with _usage_lock:
+        LLM_USAGE["calls"] += 1
+        LLM_USAGE["prompt_tokens"] += usage.prompt_tokens or 0
+        LLM_USAGE["cached_tokens"] += cached
+
+def get_llm_usage() -> dict:
+    """Snapshot of the call_llm counters plus the prompt-cache hit rate"""
+    with _usage_lock:
+        usage = dict(LLM_USAGE)
+    prompt = usage["prompt_tokens"]
+    usage["cached_ratio"] = round(usage["cached_tokens"] / prompt, 3) if prompt else 0.0
+    return usage
+
+# Deterministic (temperature 0) completions are reused for identical requests:
+# prompt hash -> (ts, text). Retries and page refreshes then cost nothing.
+LLM_CACHE_TTL_SEC = int(os.environ.get("LLM_CACHE_TTL_SEC", "21600"))  # 6h
+LLM_CACHE_MAX = 256
+_LLM_CACHE: "OrderedDict[str, tuple[float, str]]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+def _cache_key(*parts) -> str:
+    return hashlib.blake2b(json.dumps(parts).encode(), digest_size=16).hexdigest()
+
+def _cache_get(key: str):
+    with _cache_lock:
+        hit = _LLM_CACHE.get(key)
+        if not hit or time.monotonic() - hit[0] >= LLM_CACHE_TTL_SEC:
+            return None
+        _LLM_CACHE.move_to_end(key)
+        return hit[1]
+
+def _cache_put(key: str, value: str) -> None:
+    with _cache_lock:
+        _LLM_CACHE[key] = (time.monotonic(), value)
+        _LLM_CACHE.move_to_end(key)
+        while len(_LLM_CACHE) > LLM_CACHE_MAX:
+            _LLM_CACHE.popitem(last=False)
+
+def _messages(prompt: str, system: str = None) -> list:
+    messages = [{"role": "user", "content": prompt}]
+    if system:
+        messages.insert(0, {"role": "system", "content": system})
+    return messages
+
+def call_llm(prompt: str, max_tokens: int = 1000, temperature: float = 0.0, system: str = None,
+             response_format: dict = None) -> str:
+    """Generic LLM call function for synthesis tasks.
+
+    Pass the static instructions as `system` and only the per-call data as
+    `prompt`, so the provider can reuse its cache for the shared prefix.
+    `response_format={"type": "json_object"}` requests structured JSON output.
+    At temperature 0 identical requests are answered from an in-process cache.
+    """
+    model = LLM_SYNTHESIS_MODEL
+    key = None
+    if temperature == 0:
+        key = _cache_key(model, system, prompt, max_tokens, response_format)
+        cached = _cache_get(key)
+        if cached is not None:
+            return cached
+    
+    extra = {"response_format": response_format} if response_format else {}
     try:
         rsp = CLIENT.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[{"role": "user", "content": prompt}],
+            model=model,
+            messages=_messages(prompt, system),
             temperature=temperature,
             max_tokens=max_tokens,
+            **extra,
         )
-        return (rsp.choices[0].message.content or "").strip()
+        _record_usage(rsp.usage)
+        text = (rsp.choices[0].message.content or "").strip()
     except Exception as e:
         return f"Error generating content: {str(e)}"
+    
+    if key:
+        _cache_put(key, text)
+    return text
+
+def stream_llm(prompt: str, max_tokens: int = 1000, temperature: float = 0.0, system: str = None) -> Iterator[str]:
+    """Like call_llm, but yields text chunks as the model generates them.
+
+    Consumers can show the start of a long completion after the first tokens
+    instead of waiting for the whole thing. Errors propagate to the caller.
+    """
+    stream = CLIENT.chat.completions.create(
+        model=LLM_SYNTHESIS_MODEL,
+        messages=_messages(prompt, system),
+        temperature=temperature,
+        max_tokens=max_tokens,
+        stream=True,
+    )
+    for chunk in stream:
+        if chunk.choices:
+            delta = chunk.choices[0].delta.content
+            if delta:
+                yield delta
@@ -4,8 +4,11 @@ V2 Macro Data Integration
 Fetches key construction/real estate indicators for "What moved" section
 """
 import os
+import threading
+import time
 import httpx
-from typing import Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime, timedelta
 from .config import DATABASE_URL
 
@@ -23,13 +26,31 @@ FRED_SERIES = {
 # NAHB Housing Market Index (requires separate API or scraping)
 NAHB_HMI_URL = "https://www.nahb.org/news-and-economics/housing-economics/indices/housing-market-index"
 
-def fetch_fred_data(series_id: str, limit: int = 5) -> Optional[Dict[str, Any]]:
-    """Fetch data from FRED API"""
+FRED_OBSERVATIONS_URL = "https://api.stlouisfed.org/fred/series/observations"
+
+# One keep-alive client for all FRED calls (httpx.Client is thread-safe), so
+# repeat and concurrent fetches skip the TCP+TLS handshake
+_CLIENT = httpx.Client(timeout=10, limits=httpx.Limits(max_connections=8, max_keepalive_connections=8))
+
+# FRED series update at most daily; keep responses for an hour in-process.
+# (series_id, limit) -> (fetched_at, observations)
+FRED_CACHE_TTL_SEC = int(os.environ.get("FRED_CACHE_TTL_SEC", "3600"))
+_FRED_CACHE: Dict[Tuple[str, int], Tuple[float, List[Dict[str, Any]]]] = {}
+_fred_lock = threading.Lock()
+
+def fetch_fred_observations(series_id: str, limit: int = 5) -> Optional[List[Dict[str, Any]]]:
+    """Latest observations for a FRED series, newest first (cached for FRED_CACHE_TTL_SEC)"""
     if not FRED_API_KEY:
         return None
+    
+    key = (series_id, limit)
+    now = time.monotonic()
+    with _fred_lock:
+        hit = _FRED_CACHE.get(key)
+    if hit and now - hit[0] < FRED_CACHE_TTL_SEC:
+        return hit[1]
         
     try:
-        url = f"https://api.stlouisfed.org/fred/series/observations"
         params = {
             "series_id": series_id,
             "api_key": FRED_API_KEY,
@@ -38,79 +59,70 @@ def fetch_fred_data(series_id: str, limit: int = 5) -> Optional[Dict[str, Any]]:
             "limit": limit
         }
         
-        with httpx.Client(timeout=10) as client:
-            response = client.get(url, params=params)
-            if response.status_code == 200:
-                data = response.json()
-                if "observations" in data and data["observations"]:
-                    latest = data["observations"][0]
-                    return {
-                        "value": latest.get("value"),
-                        "date": latest.get("date"),
-                        "series_id": series_id
-                    }
+        response = _CLIENT.get(FRED_OBSERVATIONS_URL, params=params)
+        if response.status_code == 200:
+            observations = response.json().get("observations") or []
+            if observations:
+                with _fred_lock:
+                    _FRED_CACHE[key] = (now, observations)
+                return observations
     except Exception as e:
         print(f"Error fetching FRED data for {series_id}: {e}")
     
     return None
 
+def fetch_fred_data(series_id: str, limit: int = 5) -> Optional[Dict[str, Any]]:
+    """Fetch data from FRED API"""
+    observations = fetch_fred_observations(series_id, limit)
+    if not observations:
+        return None
+    latest = observations[0]
+    return {
+        "value": latest.get("value"),
+        "date": latest.get("date"),
+        "series_id": series_id
+    }
+
 def calculate_change(current: float, previous: float) -> str:
     """Calculate and format percentage change"""
-    if not current or not previous:
-        return "N/A"
-    
+    # Convert once; 0.0 is a valid reading, only missing/non-numeric is N/A
     try:
-        current_val = float(current)
-        previous_val = float(previous)
-        change = current_val - previous_val
-        
-        if abs(change) < 0.01:
-            return "unchanged"
-        elif change > 0:
-            return f"+{change:.1f} bps" if abs(change) < 1 else f"+{change:.1f}%"
-        else:
-            return f"{change:.1f} bps" if abs(change) < 1 else f"{change:.1f}%"
+        current_val, previous_val = float(current), float(previous)
     except (ValueError, TypeError):
         return "N/A"
+    
+    change = current_val - previous_val
+    if abs(change) < 0.01:
+        return "unchanged"
+    
+    sign = "+" if change > 0 else ""
+    suffix = " bps" if abs(change) < 1 else "%"
+    return f"{sign}{change:.1f}{suffix}"
 
 def fetch_treasury_10y() -> str:
     """Get 10-Year Treasury rate with change"""
-    data = fetch_fred_data("DGS10", limit=2)
-    if not data:
+    # One request yields both the current and previous value for the change
+    observations = fetch_fred_observations("DGS10", limit=2)
+    if not observations:
         return "10Y N/A"
     
     try:
-        # Get current and previous values for change calculation
-        with httpx.Client(timeout=10) as client:
-            response = client.get(
-                "https://api.stlouisfed.org/fred/series/observations",
-                params={
-                    "series_id": "DGS10",
-                    "api_key": FRED_API_KEY,
-                    "file_type": "json",
-                    "sort_order": "desc",
-                    "limit": 2
-                }
-            )
+        if len(observations) >= 2:
+            current = observations[0].get("value")
+            previous = observations[1].get("value")
             
-            if response.status_code == 200:
-                observations = response.json().get("observations", [])
-                if len(observations) >= 2:
-                    current = observations[0].get("value")
-                    previous = observations[1].get("value")
-                    
-                    if current and current != "." and previous and previous != ".":
-                        change = float(current) - float(previous)
-                        change_bps = change * 100  # Convert to basis points
-                        
-                        if abs(change_bps) < 0.1:
-                            return f"10Y {current}% (unch)"
-                        elif change_bps > 0:
-                            return f"10Y {current}% (+{change_bps:.0f}bps)"
-                        else:
-                            return f"10Y {current}% ({change_bps:.0f}bps)"
-                    else:
-                        return f"10Y {current}%"
+            if current and current != "." and previous and previous != ".":
+                change = float(current) - float(previous)
+                change_bps = change * 100  # Convert to basis points
+                
+                if abs(change_bps) < 0.1:
+                    return f"10Y {current}% (unch)"
+                elif change_bps > 0:
+                    return f"10Y {current}% (+{change_bps:.0f}bps)"
+                else:
+                    return f"10Y {current}% ({change_bps:.0f}bps)"
+            else:
+                return f"10Y {current}%"
     except Exception:
         pass
     
@@ -147,12 +159,17 @@ def get_macro_indicators() -> str:
 
 def get_detailed_metrics() -> Dict[str, Any]:
     """Get detailed macro metrics for analysis (optional endpoint)"""
-    return {
-        "treasury_10y": fetch_fred_data("DGS10"),
-        "construction_spending": fetch_fred_data("TTLCONS"),
-        "housing_starts": fetch_fred_data("HOUST"),
-        "building_permits": fetch_fred_data("PERMIT"),
-        "nahb_hmi": {"note": "Requires separate integration"},
-        "dodge_momentum": {"note": "Requires Dodge Data subscription"}
+    series = {
+        "treasury_10y": "DGS10",
+        "construction_spending": "TTLCONS",
+        "housing_starts": "HOUST",
+        "building_permits": "PERMIT"
     }
+    # The four series are independent network calls; fetch them side by side
+    with ThreadPoolExecutor(max_workers=len(series)) as pool:
+        metrics = dict(zip(series, pool.map(fetch_fred_data, series.values())))
+    
+    metrics["nahb_hmi"] = {"note": "Requires separate integration"}
+    metrics["dodge_momentum"] = {"note": "Requires Dodge Data subscription"}
+    return metrics
 
@@ -6,6 +6,7 @@ This will force a new deployment with database initialization
 from fastapi import FastAPI, Query, HTTPException
 from datetime import datetime, timezone, timedelta
 import os
+from functools import lru_cache
 from sqlalchemy import create_engine, text
 from typing import List, Dict, Any
 
@@ -16,7 +17,16 @@ app = FastAPI(
     description="Completely new API version with guaranteed database initialization"
 )
 
-# Database engine function
+ENGINE_POOL_OPTIONS = {
+    "pool_size": 10,
+    "max_overflow": 5,
+    "pool_pre_ping": True,   # drop connections the server closed while idle
+    "pool_recycle": 1800,
+}
+
+# Database engine function; cached so every request shares one warm pool
+# instead of building a new engine (and empty QueuePool) per call
+@lru_cache(maxsize=1)
 def get_database_engine():
     """Get database engine with proper error handling"""
     database_url = os.getenv("DATABASE_URL")
@@ -25,67 +35,73 @@ def get_database_engine():
     
     try:
         import psycopg
-        engine = create_engine(database_url)
+        engine = create_engine(database_url, **ENGINE_POOL_OPTIONS)
     except ImportError:
         try:
             import psycopg2
-            engine = create_engine(database_url)
+            engine = create_engine(database_url, **ENGINE_POOL_OPTIONS)
         except ImportError:
             raise ImportError("Neither psycopg nor psycopg2 is available")
     
     return engine
 
+# Schema DDL, built once at import and run in a single transaction
+SCHEMA_STATEMENTS = (
+    # Create articles table
+    text("""
+        CREATE TABLE IF NOT EXISTS articles (
+            id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+            url TEXT UNIQUE NOT NULL,
+            source TEXT,
+            title TEXT,
+            summary_raw TEXT,
+            content TEXT,
+            published_at TIMESTAMP WITH TIME ZONE,
+            fetched_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+            lang TEXT DEFAULT 'en',
+            status TEXT DEFAULT 'new'
+        )
+    """),
+    # Create article_scores table
+    text("""
+        CREATE TABLE IF NOT EXISTS article_scores (
+            id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+            article_id UUID REFERENCES articles(id) ON DELETE CASCADE,
+            composite_score FLOAT,
+            topics TEXT[],
+            geography TEXT,
+            macro_flag TEXT,
+            summary2 TEXT,
+            why1 TEXT,
+            project_stage TEXT,
+            needs_fact_check BOOLEAN DEFAULT FALSE,
+            media_type TEXT DEFAULT 'article',
+            created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+        )
+    """),
+    # Create indexes
+    text("CREATE INDEX IF NOT EXISTS idx_articles_url ON articles(url)"),
+    text("CREATE INDEX IF NOT EXISTS idx_articles_published_at ON articles(published_at)"),
+    text("CREATE INDEX IF NOT EXISTS idx_articles_status ON articles(status)"),
+    text("CREATE INDEX IF NOT EXISTS idx_article_scores_article_id ON article_scores(article_id)"),
+    # Same ranking index as app/db.py's schema; it covers composite_score
+    # lookups, so the old single-column index only added write overhead
+    text("CREATE INDEX IF NOT EXISTS idx_scores_rank ON article_scores(composite_score DESC, article_id)"),
+    text("DROP INDEX IF EXISTS idx_article_scores_composite_score"),
+    text("CREATE INDEX IF NOT EXISTS idx_article_scores_topics ON article_scores USING GIN(topics)"),
+)
+
 # Database initialization
 def initialize_database_tables():
     """Initialize database tables"""
     try:
         engine = get_database_engine()
         
-        with engine.connect() as conn:
-            # Create articles table
-            conn.execute(text("""
-                CREATE TABLE IF NOT EXISTS articles (
-                    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
-                    url TEXT UNIQUE NOT NULL,
-                    source TEXT,
-                    title TEXT,
-                    summary_raw TEXT,
-                    content TEXT,
-                    published_at TIMESTAMP WITH TIME ZONE,
-                    fetched_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
-                    lang TEXT DEFAULT 'en',
-                    status TEXT DEFAULT 'new'
-                )
-            """))
-            
-            # Create article_scores table
-            conn.execute(text("""
-                CREATE TABLE IF NOT EXISTS article_scores (
-                    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
-                    article_id UUID REFERENCES articles(id) ON DELETE CASCADE,
-                    composite_score FLOAT,
-                    topics TEXT[],
-                    geography TEXT,
-                    macro_flag TEXT,
-                    summary2 TEXT,
-                    why1 TEXT,
-                    project_stage TEXT,
-                    needs_fact_check BOOLEAN DEFAULT FALSE,
-                    media_type TEXT DEFAULT 'article',
-                    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
-                )
-            """))
-            
-            # Create indexes
-            conn.execute(text("CREATE INDEX IF NOT EXISTS idx_articles_url ON articles(url)"))
-            conn.execute(text("CREATE INDEX IF NOT EXISTS idx_articles_published_at ON articles(published_at)"))
-            conn.execute(text("CREATE INDEX IF NOT EXISTS idx_articles_status ON articles(status)"))
-            conn.execute(text("CREATE INDEX IF NOT EXISTS idx_article_scores_article_id ON article_scores(article_id)"))
-            conn.execute(text("CREATE INDEX IF NOT EXISTS idx_article_scores_composite_score ON article_scores(composite_score)"))
-            conn.execute(text("CREATE INDEX IF NOT EXISTS idx_article_scores_topics ON article_scores USING GIN(topics)"))
-            
-            conn.commit()
-            return True
+        # begin() commits on success and rolls back on error
+        with engine.begin() as conn:
+            for statement in SCHEMA_STATEMENTS:
+                conn.execute(statement)
+        return True
             
     except Exception as e:
         print(f"Database initialization failed: {e}")
@@ -129,6 +145,8 @@ def root_endpoint():
             "/initialize-database",
             "/clear-database",
             "/api/articles",
+            "/api/narrative/stream",
+            "/api/llm/usage",
             "/api/crawl"
         ]
     }
@@ -140,13 +158,11 @@ def test_database_connection():
     try:
         engine = get_database_engine()
         with engine.connect() as conn:
-            # Test articles table
-            result = conn.execute(text("SELECT COUNT(*) FROM articles"))
-            article_count = result.fetchone()[0]
-            
-            # Test scores table
-            result = conn.execute(text("SELECT COUNT(*) FROM article_scores"))
-            scores_count = result.fetchone()[0]
+            # Test articles and scores tables in one round-trip
+            article_count, scores_count = conn.execute(text("""
+                SELECT (SELECT COUNT(*) FROM articles),
+                       (SELECT COUNT(*) FROM article_scores)
+            """)).one()
             
             return {
                 "ok": True,
@@ -255,6 +271,40 @@ def get_articles(
             "timestamp": datetime.now().isoformat()
         }
 
+# Narrative brief endpoint, streamed as the model writes it
+@app.get("/api/narrative/stream")
+def stream_narrative(days_back: int = Query(1, ge=1, le=7)):
+    """Stream the daily narrative brief as plain text"""
+    # Imported here: the synthesis stack needs OPENAI_API_KEY at import time
+    from itertools import chain
+    from fastapi.responses import StreamingResponse
+    from .narrative_synthesis import stream_daily_narrative
+    
+    # Pull the first chunk before any headers go out: that runs the source
+    # query and opens the LLM stream, so their failures become a real 5xx
+    # instead of a 200 with a truncated body
+    chunks = stream_daily_narrative(days_back=days_back)
+    try:
+        first = next(chunks, "")
+    except Exception as e:
+        raise HTTPException(status_code=502, detail=f"Narrative synthesis failed: {e}")
+    
+    return StreamingResponse(
+        chain([first], chunks),
+        media_type="text/plain; charset=utf-8"
+    )
+
+# LLM usage endpoint (prompt-cache effectiveness for synthesis calls)
+@app.get("/api/llm/usage")
+def llm_usage():
+    """Token and prompt-cache counters for this process's LLM calls"""
+    from .llm import get_llm_usage
+    return {
+        "ok": True,
+        "usage": get_llm_usage(),
+        "timestamp": datetime.now().isoformat()
+    }
+
 # Crawl endpoint
 @app.post("/api/crawl")
 def run_crawl(limit: int = Query(50, ge=1, le=500)):
@@ -6,6 +6,7 @@ This will force a new deployment
 from fastapi import FastAPI, Query, HTTPException
 from datetime import datetime, timezone, timedelta
 import os
+from functools import lru_cache
 from sqlalchemy import create_engine, text
 from typing import List, Dict, Any
 
@@ -16,7 +17,16 @@ app = FastAPI(
     description="Completely new API version with guaranteed database initialization"
 )
 
-# Database engine function
+ENGINE_POOL_OPTIONS = {
+    "pool_size": 10,
+    "max_overflow": 5,
+    "pool_pre_ping": True,   # drop connections the server closed while idle
+    "pool_recycle": 1800,
+}
+
+# Database engine function; cached so every request shares one warm pool
+# instead of building a new engine (and empty QueuePool) per call
+@lru_cache(maxsize=1)
 def get_database_engine():
     """Get database engine with proper error handling"""
     database_url = os.getenv("DATABASE_URL")
@@ -25,11 +35,11 @@ def get_database_engine():
     
     try:
         import psycopg
-        engine = create_engine(database_url)
+        engine = create_engine(database_url, **ENGINE_POOL_OPTIONS)
     except ImportError:
         try:
             import psycopg2
-            engine = create_engine(database_url)
+            engine = create_engine(database_url, **ENGINE_POOL_OPTIONS)
         except ImportError:
             raise ImportError("Neither psycopg nor psycopg2 is available")
     
@@ -81,7 +91,10 @@ def initialize_database_tables():
             conn.execute(text("CREATE INDEX IF NOT EXISTS idx_articles_published_at ON articles(published_at)"))
             conn.execute(text("CREATE INDEX IF NOT EXISTS idx_articles_status ON articles(status)"))
             conn.execute(text("CREATE INDEX IF NOT EXISTS idx_article_scores_article_id ON article_scores(article_id)"))
-            conn.execute(text("CREATE INDEX IF NOT EXISTS idx_article_scores_composite_score ON article_scores(composite_score)"))
+            # Same ranking index as app/db.py's schema; it covers composite_score
+            # lookups, so the old single-column index only added write overhead
+            conn.execute(text("CREATE INDEX IF NOT EXISTS idx_scores_rank ON article_scores(composite_score DESC, article_id)"))
+            conn.execute(text("DROP INDEX IF EXISTS idx_article_scores_composite_score"))
             conn.execute(text("CREATE INDEX IF NOT EXISTS idx_article_scores_topics ON article_scores USING GIN(topics)"))
             
             conn.commit()
@@ -140,13 +153,11 @@ def test_database_connection():
     try:
         engine = get_database_engine()
         with engine.connect() as conn:
-            # Test articles table
-            result = conn.execute(text("SELECT COUNT(*) FROM articles"))
-            article_count = result.fetchone()[0]
-            
-            # Test scores table
-            result = conn.execute(text("SELECT COUNT(*) FROM article_scores"))
-            scores_count = result.fetchone()[0]
+            # Test articles and scores tables in one round-trip
+            article_count, scores_count = conn.execute(text("""
+                SELECT (SELECT COUNT(*) FROM articles),
+                       (SELECT COUNT(*) FROM article_scores)
+            """)).one()
             
             return {
                 "ok": True,
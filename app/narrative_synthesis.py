@@ -1,11 +1,13 @@
 # Narrative Synthesis - Weaves together news, research, and media into coherent intelligence
-from typing import Dict, List, Any, Optional
+from typing import Dict, Iterator, List, Any, Optional
 from datetime import datetime, timezone, timedelta
 
 from sqlalchemy import text
 from .db import SessionLocal
-from .llm import call_llm
+from .llm import call_llm, stream_llm
 
+# Static instructions, sent as the system message; keeping them byte-identical
+# across calls lets the provider serve this prefix from its prompt cache
 SYNTHESIS_PROMPT = """You are a construction and real estate intelligence analyst creating a daily executive brief.
 
 Given the following sources:
@@ -27,129 +29,148 @@ CRITICAL RULES:
 - Sound like a sharp analyst, not a generic news aggregator
 - Keep it under 300 words total
 
-SOURCES:
-{sources}
-
 Create a brief with:
 - HEADLINE: One punchy line (under 100 chars)
 - THE STORY: 2-3 paragraphs weaving everything together
 - WATCH THIS: One recommended video/podcast with why it's relevant
 - BOTTOM LINE: One sentence action for readers
+
+The sources follow in the user message.
 """
 
-def synthesize_daily_narrative(days_back: int = 1) -> Dict[str, Any]:
-    """Generate narrative brief by synthesizing multiple content types"""
+def _clip(text_value: Optional[str], limit: int) -> str:
+    """First `limit` chars, with "..." only when something was actually cut"""
+    text_value = text_value or ""
+    return text_value if len(text_value) <= limit else text_value[:limit] + "..."
+
+def _gather_sources(days_back: int):
+    """Fetch the news/research/video sources and format them as the user prompt.
+
+    Returns (prompt, news_rows, research_rows, video_rows).
+    """
     
-    db = SessionLocal()
     cutoff = datetime.now(timezone.utc) - timedelta(days=days_back)
     
-    try:
-        # Get top news articles
-        news_rows = db.execute(text("""
-            SELECT a.title, a.source, a.content, a.url, s.composite_score, s.topics
-            FROM articles a
-            JOIN article_scores s ON s.article_id = a.id
-            WHERE a.published_at >= :cutoff
-              AND s.composite_score > 80
-              AND 'research_report' != ANY(COALESCE(s.topics, ARRAY[]::text[]))
-              AND 'video_content' != ANY(COALESCE(s.topics, ARRAY[]::text[]))
-            ORDER BY s.composite_score DESC
-            LIMIT 10
+    with SessionLocal() as db:
+        # News, research and video buckets in one round-trip; each branch keeps
+        # its own filter, ordering and limit. Content is cut server-side to one
+        # char past the _clip limit below, so "..." still marks real truncation
+        rows = db.execute(text("""
+            (SELECT 'news' AS bucket, LEFT(a.title, 200) AS title, a.source, LEFT(a.content, 501) AS content, a.url, s.composite_score, s.topics
+             FROM articles a
+             JOIN article_scores s ON s.article_id = a.id
+             WHERE a.published_at >= :cutoff
+               AND s.composite_score > 80
+               AND NOT (COALESCE(s.topics, ARRAY[]::text[]) && ARRAY['research_report', 'video_content'])
+             ORDER BY s.composite_score DESC
+             LIMIT 10)
+            UNION ALL
+            (SELECT 'research' AS bucket, LEFT(a.title, 200) AS title, a.source, LEFT(a.content, 801) AS content, a.url, s.composite_score, s.topics
+             FROM articles a
+             LEFT JOIN article_scores s ON s.article_id = a.id
+             WHERE a.published_at >= :cutoff
+               AND (s.topics @> ARRAY['research_report']
+                    OR a.source IN ('JLL', 'CBRE', 'Cushman & Wakefield', 'Savills', 'Colliers'))
+             ORDER BY a.published_at DESC
+             LIMIT 5)
+            UNION ALL
+            (SELECT 'video' AS bucket, LEFT(a.title, 200) AS title, a.source, LEFT(a.content, 401) AS content, a.url, s.composite_score, s.topics
+             FROM articles a
+             JOIN article_scores s ON s.article_id = a.id
+             WHERE a.published_at >= :cutoff
+               AND s.topics @> ARRAY['video_content']
+             ORDER BY s.composite_score DESC NULLS LAST
+             LIMIT 5)
         """), {"cutoff": cutoff.isoformat()}).mappings().all()
         
-        # Get research reports
-        research_rows = db.execute(text("""
-            SELECT a.title, a.source, a.content, a.url
-            FROM articles a
-            LEFT JOIN article_scores s ON s.article_id = a.id
-            WHERE a.published_at >= :cutoff
-              AND ('research_report' = ANY(COALESCE(s.topics, ARRAY[]::text[]))
-                   OR a.source IN ('JLL', 'CBRE', 'Cushman & Wakefield', 'Savills', 'Colliers'))
-            ORDER BY a.published_at DESC
-            LIMIT 5
-        """), {"cutoff": cutoff.isoformat()}).mappings().all()
-        
-        # Get video/podcast content
-        video_rows = db.execute(text("""
-            SELECT a.title, a.source, a.content, a.url, s.composite_score
-            FROM articles a
-            LEFT JOIN article_scores s ON s.article_id = a.id
-            WHERE a.published_at >= :cutoff
-              AND 'video_content' = ANY(COALESCE(s.topics, ARRAY[]::text[]))
-            ORDER BY COALESCE(s.composite_score, 0) DESC
-            LIMIT 5
-        """), {"cutoff": cutoff.isoformat()}).mappings().all()
+        buckets = {"news": [], "research": [], "video": []}
+        for row in rows:
+            buckets[row["bucket"]].append(row)
+        news_rows, research_rows, video_rows = buckets["news"], buckets["research"], buckets["video"]
         
-        # Format sources for LLM
-        sources_text = "=== NEWS ARTICLES ===\n"
-        for i, row in enumerate(news_rows, 1):
-            sources_text += f"\n{i}. {row['title']} ({row['source']})\n"
-            sources_text += f"   Score: {row.get('composite_score', 0)}\n"
-            sources_text += f"   Topics: {row.get('topics', [])}\n"
-            sources_text += f"   Content: {row['content'][:500]}...\n"
+        # Format sources for LLM: collect the pieces and join once
+        parts = ["SOURCES:\n=== NEWS ARTICLES ===\n"]
+        parts.extend(
+            f"\n{i}. {row['title']} ({row['source']})\n"
+            f"   Score: {row.get('composite_score', 0)}\n"
+            f"   Topics: {row.get('topics', [])}\n"
+            f"   Content: {_clip(row['content'], 500)}\n"
+            for i, row in enumerate(news_rows, 1)
+        )
         
-        sources_text += "\n\n=== RESEARCH REPORTS ===\n"
-        for i, row in enumerate(research_rows, 1):
-            sources_text += f"\n{i}. {row['title']} ({row['source']})\n"
-            sources_text += f"   Content: {row['content'][:800]}...\n"
+        parts.append("\n\n=== RESEARCH REPORTS ===\n")
+        parts.extend(
+            f"\n{i}. {row['title']} ({row['source']})\n"
+            f"   Content: {_clip(row['content'], 800)}\n"
+            for i, row in enumerate(research_rows, 1)
+        )
         
-        sources_text += "\n\n=== VIDEO/PODCAST CONTENT ===\n"
-        for i, row in enumerate(video_rows, 1):
-            sources_text += f"\n{i}. {row['title']} ({row['source']})\n"
-            sources_text += f"   URL: {row['url']}\n"
-            sources_text += f"   Transcript excerpt: {row['content'][:400]}...\n"
+        parts.append("\n\n=== VIDEO/PODCAST CONTENT ===\n")
+        parts.extend(
+            f"\n{i}. {row['title']} ({row['source']})\n"
+            f"   URL: {row['url']}\n"
+            f"   Transcript excerpt: {_clip(row['content'], 400)}\n"
+            for i, row in enumerate(video_rows, 1)
+        )
         
-        # Call LLM for synthesis
-        prompt = SYNTHESIS_PROMPT.format(sources=sources_text)
+        return "".join(parts), news_rows, research_rows, video_rows
+
+def synthesize_daily_narrative(days_back: int = 1) -> Dict[str, Any]:
+    """Generate narrative brief by synthesizing multiple content types"""
+    
+    # Call LLM for synthesis; only the sources vary between calls
+    prompt, news_rows, research_rows, video_rows = _gather_sources(days_back)
+    
+    try:
+        synthesis = call_llm(prompt, max_tokens=800, system=SYNTHESIS_PROMPT)
         
-        try:
-            synthesis = call_llm(prompt, max_tokens=800)
-            
-            # Parse the synthesis response
-            result = {
-                "ok": True,
-                "type": "narrative_brief",
-                "date": datetime.now(timezone.utc).date().isoformat(),
-                "synthesis": synthesis,
-                "sources_used": {
-                    "news_count": len(news_rows),
-                    "research_count": len(research_rows),
-                    "video_count": len(video_rows)
-                }
+        # Parse the synthesis response
+        result = {
+            "ok": True,
+            "type": "narrative_brief",
+            "date": datetime.now(timezone.utc).date().isoformat(),
+            "synthesis": synthesis,
+            "sources_used": {
+                "news_count": len(news_rows),
+                "research_count": len(research_rows),
+                "video_count": len(video_rows)
             }
-            
-            return result
-            
-        except Exception as e:
-            print(f"[synthesis] LLM call failed: {e}")
-            # Fallback to basic summary
-            return {
-                "ok": False,
-                "error": "Synthesis failed",
-                "sources_available": {
-                    "news": len(news_rows),
-                    "research": len(research_rows),
-                    "videos": len(video_rows)
-                }
+        }
+        
+        return result
+        
+    except Exception as e:
+        print(f"[synthesis] LLM call failed: {e}")
+        # Fallback to basic summary
+        return {
+            "ok": False,
+            "error": "Synthesis failed",
+            "sources_available": {
+                "news": len(news_rows),
+                "research": len(research_rows),
+                "videos": len(video_rows)
             }
-    
-    finally:
-        db.close()
+        }
+
+def stream_daily_narrative(days_back: int = 1) -> Iterator[str]:
+    """Same brief as synthesize_daily_narrative, yielded as the model writes it
+    (e.g. for a StreamingResponse), so the headline shows up in about a second"""
+    prompt, _, _, _ = _gather_sources(days_back)
+    yield from stream_llm(prompt, max_tokens=800, system=SYNTHESIS_PROMPT)
 
 def get_recommended_content(content_type: str = "video") -> Optional[Dict[str, Any]]:
     """Get the top recommended video or podcast for the day"""
     
-    db = SessionLocal()
     cutoff = datetime.now(timezone.utc) - timedelta(days=7)
     
-    try:
+    with SessionLocal() as db:
         row = db.execute(text("""
             SELECT a.title, a.source, a.url, a.summary_raw, s.composite_score, s.topics
             FROM articles a
             JOIN article_scores s ON s.article_id = a.id
             WHERE a.published_at >= :cutoff
-              AND 'video_content' = ANY(s.topics)
-            ORDER BY s.composite_score DESC
+              AND s.topics @> ARRAY['video_content']
+            ORDER BY s.composite_score DESC NULLS LAST
             LIMIT 1
         """), {"cutoff": cutoff.isoformat()}).mappings().fetchone()
         
@@ -164,9 +185,6 @@ def get_recommended_content(content_type: str = "video") -> Optional[Dict[str, A
             }
         
         return None
-    
-    finally:
-        db.close()
 
 def run():
     """Generate and return narrative synthesis"""
@@ -1,7 +1,7 @@
-from typing import List, Dict, Any
+import json
+from typing import List, Dict, Any, Tuple
 from sqlalchemy import text
-from sqlalchemy.exc import SQLAlchemyError
-from .db import SessionLocal
+from .db import SessionLocal, is_postgres, session_scope
 
 # -------- Category keyword sets --------
 # Developer-focused content: practical, actionable building processes and technologies
@@ -305,74 +305,77 @@ def fetch_new_articles(limit: int = 50) -> List[Dict[str, Any]]:
     finally:
         db.close()
 
+_UPSERT_SCORES = text("""
+    INSERT INTO article_scores (
+        article_id, rel_building_practices, rel_market, rel_design_business,
+        importance_multiplier, freshness_bonus, composite_score, topics,
+        geography, macro_flag, summary2, why1, project_stage, needs_fact_check, media_type
+    )
+    VALUES (
+        :article_id, :rbp, :rm, :rdb, :imp, :fresh, :comp, :topics,
+        :geo, :macro, :summary2, :why1, :project_stage, :needs_fact_check, :media_type
+    )
+    ON CONFLICT (article_id) DO UPDATE SET
+        rel_building_practices = EXCLUDED.rel_building_practices,
+        rel_market = EXCLUDED.rel_market,
+        rel_design_business = EXCLUDED.rel_design_business,
+        importance_multiplier = EXCLUDED.importance_multiplier,
+        freshness_bonus = EXCLUDED.freshness_bonus,
+        composite_score = EXCLUDED.composite_score,
+        topics = EXCLUDED.topics,
+        geography = EXCLUDED.geography,
+        macro_flag = EXCLUDED.macro_flag,
+        summary2 = EXCLUDED.summary2,
+        why1 = EXCLUDED.why1,
+        project_stage = EXCLUDED.project_stage,
+        needs_fact_check = EXCLUDED.needs_fact_check,
+        media_type = EXCLUDED.media_type
+""")
+
+def _score_params(article_id: str, scores: Dict[str, Any]) -> Dict[str, Any]:
+    # Convert lists based on database type
+    topics = scores.get("topics", [])
+    geography = scores.get("geography", [])
+    
+    if is_postgres:
+        # PostgreSQL expects actual arrays, not JSON strings
+        topics_data = topics
+        geography_data = geography
+    else:
+        # SQLite expects JSON strings
+        topics_data = json.dumps(topics)
+        geography_data = json.dumps(geography)
+    
+    return {
+        "article_id": article_id,
+        "rbp": scores.get("rel_building_practices", 0),
+        "rm": scores.get("rel_market", 0),
+        "rdb": scores.get("rel_design_business", 0),
+        "imp": scores.get("importance_multiplier", 1.0),
+        "fresh": scores.get("freshness_bonus", 0.0),
+        "comp": scores.get("composite_score", 0.0),
+        "topics": topics_data,
+        "geo": geography_data,
+        "macro": scores.get("macro_flag", False),
+        "summary2": scores.get("summary2", None),
+        "why1": scores.get("why1", None),
+        "project_stage": scores.get("project_stage", None),
+        "needs_fact_check": scores.get("needs_fact_check", False),
+        "media_type": scores.get("media_type", "article"),
+    }
+
+def save_scores_batch(items: List[Tuple[str, Dict[str, Any]]]) -> None:
+    """Upsert many (article_id, scores) pairs and mark them scored in one transaction"""
+    if not items:
+        return
+    # executemany: the driver batches the rows instead of one round-trip each
+    with session_scope() as db:
+        db.execute(_UPSERT_SCORES, [_score_params(article_id, scores) for article_id, scores in items])
+        db.execute(text("UPDATE articles SET status='scored' WHERE id=:id"),
+                   [{"id": article_id} for article_id, _ in items])
+
 def save_scores(article_id: str, scores: Dict[str, Any]) -> None:
-    db = SessionLocal()
-    try:
-        import json
-        from .db import is_postgres
-        
-        # Convert lists based on database type
-        topics = scores.get("topics", [])
-        geography = scores.get("geography", [])
-        
-        if is_postgres:
-            # PostgreSQL expects actual arrays, not JSON strings
-            topics_data = topics
-            geography_data = geography
-        else:
-            # SQLite expects JSON strings
-            topics_data = json.dumps(topics)
-            geography_data = json.dumps(geography)
-        
-        db.execute(text("""
-            INSERT INTO article_scores (
-                article_id, rel_building_practices, rel_market, rel_design_business,
-                importance_multiplier, freshness_bonus, composite_score, topics,
-                geography, macro_flag, summary2, why1, project_stage, needs_fact_check, media_type
-            )
-            VALUES (
-                :article_id, :rbp, :rm, :rdb, :imp, :fresh, :comp, :topics,
-                :geo, :macro, :summary2, :why1, :project_stage, :needs_fact_check, :media_type
-            )
-            ON CONFLICT (article_id) DO UPDATE SET
-                rel_building_practices = EXCLUDED.rel_building_practices,
-                rel_market = EXCLUDED.rel_market,
-                rel_design_business = EXCLUDED.rel_design_business,
-                importance_multiplier = EXCLUDED.importance_multiplier,
-                freshness_bonus = EXCLUDED.freshness_bonus,
-                composite_score = EXCLUDED.composite_score,
-                topics = EXCLUDED.topics,
-                geography = EXCLUDED.geography,
-                macro_flag = EXCLUDED.macro_flag,
-                summary2 = EXCLUDED.summary2,
-                why1 = EXCLUDED.why1,
-                project_stage = EXCLUDED.project_stage,
-                needs_fact_check = EXCLUDED.needs_fact_check,
-                media_type = EXCLUDED.media_type
-        """), {
-            "article_id": article_id,
-            "rbp": scores.get("rel_building_practices", 0),
-            "rm": scores.get("rel_market", 0),
-            "rdb": scores.get("rel_design_business", 0),
-            "imp": scores.get("importance_multiplier", 1.0),
-            "fresh": scores.get("freshness_bonus", 0.0),
-            "comp": scores.get("composite_score", 0.0),
-            "topics": topics_data,
-            "geo": geography_data,
-            "macro": scores.get("macro_flag", False),
-            "summary2": scores.get("summary2", None),
-            "why1": scores.get("why1", None),
-            "project_stage": scores.get("project_stage", None),
-            "needs_fact_check": scores.get("needs_fact_check", False),
-            "media_type": scores.get("media_type", "article"),
-        })
-        db.execute(text("UPDATE articles SET status='scored' WHERE id=:id"), {"id": article_id})
-        db.commit()
-    except SQLAlchemyError:
-        db.rollback()
-        raise
-    finally:
-        db.close()
+    save_scores_batch([(article_id, scores)])
 
 def _detect_project_stage(text_blob: str) -> str:
     """Detect project development stage from article text"""
@@ -884,8 +887,8 @@ def naive_score(row: Dict[str, Any]) -> Dict[str, Any]:
 
 def run(limit: int = 50) -> Dict[str, Any]:
     arts = fetch_new_articles(limit=limit)
-    scored = 0
-    excluded = 0
+    scored_items = []
+    discarded_ids = []
     
     for a in arts:
         # scores = score_article_with_llm(...)
@@ -894,17 +897,19 @@ def run(limit: int = 50) -> Dict[str, Any]:
         # If scores is None, the article was excluded (furniture/experimental architecture)
         if scores is None:
             print(f"Excluding non-developer content: {a.get('title', 'No title')[:60]}...")
-            # Mark article as discarded
-            db = SessionLocal()
-            try:
-                db.execute(text("UPDATE articles SET status='discarded' WHERE id=:id"), {"id": a["id"]})
-                db.commit()
-            finally:
-                db.close()
-            excluded += 1
+            discarded_ids.append({"id": a["id"]})
         else:
-            save_scores(a["id"], scores)
-            scored += 1
+            scored_items.append((a["id"], scores))
+    
+    # Persist all scores in one batched upsert
+    save_scores_batch(scored_items)
+    scored = len(scored_items)
+    
+    # Mark excluded articles as discarded in one executemany
+    if discarded_ids:
+        with session_scope() as db:
+            db.execute(text("UPDATE articles SET status='discarded' WHERE id=:id"), discarded_ids)
+    excluded = len(discarded_ids)
     
     print(f"Scored {scored} developer-relevant articles, excluded {excluded} non-developer articles")
     return {"ok": True, "scored": scored, "excluded": excluded}
@@ -3,82 +3,95 @@ Enhanced Google Search Queries for Newsletter API v4
 More comprehensive query strategy for better article coverage
 """
 
+import sys
+from itertools import chain
+
 # Current queries (working well)
-CURRENT_QUERIES = [
+CURRENT_QUERIES = (
     "construction industry news",
     "real estate development", 
     "construction technology innovation",
     "sustainable construction practices",
     "construction market trends"
-]
+)
 
 # Enhanced query sets for better coverage
 ENHANCED_QUERIES = {
-    "market_intelligence": [
+    "market_intelligence": (
         "construction market outlook 2024",
         "real estate investment trends",
         "construction spending forecast",
         "commercial real estate market",
         "construction industry growth"
-    ],
+    ),
     
-    "technology_innovation": [
+    "technology_innovation": (
         "construction technology trends",
         "building technology innovation", 
         "construction automation",
         "smart building technology",
         "construction software solutions"
-    ],
+    ),
     
-    "sustainability_green": [
+    "sustainability_green": (
         "green building trends",
         "sustainable construction methods",
         "LEED construction projects",
         "carbon neutral buildings",
         "renewable energy construction"
-    ],
+    ),
     
-    "infrastructure_development": [
+    "infrastructure_development": (
         "infrastructure investment",
         "public works construction",
         "transportation construction",
         "utility construction projects",
         "infrastructure funding"
-    ],
+    ),
     
-    "regulatory_policy": [
+    "regulatory_policy": (
         "construction regulations 2024",
         "building code updates",
         "construction safety standards",
         "environmental regulations construction",
         "construction labor laws"
-    ],
+    ),
     
-    "materials_construction": [
+    "materials_construction": (
         "construction materials innovation",
         "prefab construction trends",
         "mass timber construction",
         "concrete technology advances",
         "steel construction methods"
-    ],
+    ),
     
-    "financial_investment": [
+    "financial_investment": (
         "construction financing trends",
         "real estate investment opportunities",
         "construction project funding",
         "construction industry investment",
         "commercial real estate finance"
-    ],
+    ),
     
-    "workforce_labor": [
+    "workforce_labor": (
         "construction workforce shortage",
         "construction labor trends",
         "construction training programs",
         "construction worker safety",
         "construction industry employment"
-    ]
+    )
 }
 
+# Intern every query so a string repeated across categories is one shared object
+CURRENT_QUERIES = tuple(map(sys.intern, CURRENT_QUERIES))
+ENHANCED_QUERIES = {category: tuple(map(sys.intern, queries)) for category, queries in ENHANCED_QUERIES.items()}
+
+# Every enhanced query in category order, built once without intermediate lists
+ALL_QUERIES = tuple(chain.from_iterable(ENHANCED_QUERIES.values()))
+
+# Set views of each category for O(1) membership checks
+QUERY_SETS = {category: frozenset(queries) for category, queries in ENHANCED_QUERIES.items()}
+
 # Premium source targeting
 PREMIUM_SOURCES = [
     "constructiondive.com",
@@ -152,6 +165,8 @@ ENHANCED_STRATEGY = {
     ]
 }
 
+ENHANCED_STRATEGY = {cadence: [sys.intern(q) for q in queries] for cadence, queries in ENHANCED_STRATEGY.items()}
+
 def get_enhanced_queries_for_day():
     """Get daily query set with enhanced coverage"""
     return ENHANCED_STRATEGY["daily_queries"]
@@ -164,6 +179,10 @@ def get_enhanced_queries_for_month():
     """Get monthly query set for comprehensive coverage"""
     return ENHANCED_STRATEGY["monthly_queries"]
 
+def categorize(query):
+    """Map a query back to its ENHANCED_QUERIES category (None if it isn't one)"""
+    return next((category for category, queries in QUERY_SETS.items() if query in queries), None)
+
 def get_source_targeting_for_query_type(query_type):
     """Get appropriate source targeting for query type"""
     return SOURCE_TARGETING.get(query_type, "constructiondive.com OR enr.com OR bisnow.com OR commercialobserver.com")
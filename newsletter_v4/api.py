@@ -11,7 +11,11 @@ from sqlalchemy.orm import sessionmaker, Session
 from typing import List, Optional, Dict, Any
 from datetime import datetime, timezone, timedelta
 import asyncio
+import functools
 import json
+import threading
+import time
+from collections import OrderedDict
 
 from .config import get_config
 from .models import Base, Article, ArticleScore, ArticleInsight, Video, ContentSource
@@ -53,6 +57,59 @@ app.add_middleware(
 )
 
 
+# Short-lived in-process cache for the read endpoints: their data only changes
+# when a collect/score run lands, so repeat hits within the TTL skip the DB.
+# Keyed by handler name + query params; emptied after every admin write.
+RESPONSE_CACHE_MAX = 256
+_response_cache: "OrderedDict[tuple, tuple[float, Any]]" = OrderedDict()
+_response_cache_lock = threading.Lock()
+
+
+def cached_response(func):
+    """Serve a sync GET handler's payload from the response cache while fresh"""
+    @functools.wraps(func)
+    def wrapper(**kwargs):
+        ttl = config.api.response_cache_ttl
+        if ttl <= 0:
+            return func(**kwargs)
+        key = (func.__name__,) + tuple(sorted(
+            (name, value) for name, value in kwargs.items() if not isinstance(value, Session)
+        ))
+        with _response_cache_lock:
+            hit = _response_cache.get(key)
+            if hit and time.monotonic() - hit[0] < ttl:
+                _response_cache.move_to_end(key)
+                return hit[1]
+        result = func(**kwargs)
+        if isinstance(result, dict) and (result.get("ok") is False or "error" in result):
+            return result  # never pin a failure for the whole TTL
+        with _response_cache_lock:
+            _response_cache[key] = (time.monotonic(), result)
+            _response_cache.move_to_end(key)
+            while len(_response_cache) > RESPONSE_CACHE_MAX:
+                _response_cache.popitem(last=False)
+        return result
+    return wrapper
+
+
+def clear_response_cache():
+    with _response_cache_lock:
+        _response_cache.clear()
+
+
+@app.middleware("http")
+async def invalidate_response_cache(request, call_next):
+    """Admin writes (collect, score, generate, clear, ...) change what the read
+    endpoints return, so drop cached payloads once any of them finishes"""
+    response = await call_next(request)
+    if request.method != "GET" and request.url.path.startswith("/api/v4/admin/"):
+        clear_response_cache()
+    return response
+
+
+# Handlers that only do blocking Session work are plain `def`, so FastAPI runs
+# them in its threadpool instead of stalling the event loop for every query.
+# `async def` is kept for handlers that actually await something.
 def get_db():
     """Database dependency"""
     db = SessionLocal()
@@ -103,124 +160,92 @@ async def health_check():
 # THEME CATEGORY ENDPOINTS
 # ============================================================================
 
-@app.get("/api/v4/opportunities")
-async def get_opportunities(
-    limit: int = Query(10, ge=1, le=500),
-    min_score: float = Query(0.1, ge=0.0, le=1.0),
-    hours: int = Query(168, ge=1, le=720, description="Only articles from last N hours"),
-    db: Session = Depends(get_db)
-):
-    """Get high-relevance articles in the Opportunities category"""
-    # Calculate cutoff time for recent articles
+# Category-specific score column per theme endpoint
+THEME_SCORE_COLUMNS = {
+    "opportunities": ArticleScore.opportunities_score,
+    "practices": ArticleScore.practices_score,
+}
+
+
+def _parse_takeaways(article: Article) -> list:
+    """Takeaways are stored as JSON text; tolerate lists and bad data"""
+    if not article.takeaways:
+        return []
+    try:
+        return json.loads(article.takeaways) if isinstance(article.takeaways, str) else article.takeaways
+    except:
+        return []
+
+
+def _theme_article_payload(article: Article, score: Dict[str, Any]) -> Dict[str, Any]:
+    """Serialized article as returned by the theme endpoints"""
+    return {
+        "id": article.id,
+        "title": article.title,
+        "url": article.url,
+        "summary": article.summary,
+        "source": article.source,
+        "published_at": article.published_at.isoformat() if article.published_at else None,
+        "image_url": article.image_url or get_fallback_image(article.id),
+        "why_it_matters": article.why_it_matters or "This development represents a significant opportunity in the construction and real estate industry.",
+        "takeaways": _parse_takeaways(article),
+        "score": score,
+        "themes": article.themes
+    }
+
+
+def _theme_articles(db: Session, theme: str, limit: int, min_score: float, hours: int) -> Dict[str, Any]:
+    """Recent articles ranked by one category-specific score (not total_score)"""
+    column = THEME_SCORE_COLUMNS[theme]
     cutoff_time = datetime.now(timezone.utc) - timedelta(hours=hours)
     
-    # Query using only category-specific scores (not total_score)
     articles = db.query(Article, ArticleScore).join(
         ArticleScore, Article.id == ArticleScore.article_id
     ).filter(
         and_(
-            ArticleScore.opportunities_score >= min_score,  # Only category-specific score
+            column >= min_score,
             or_(Article.content.isnot(None), Article.summary.isnot(None)),
             or_(func.length(Article.content) > 200, func.length(Article.summary) > 200),  # Minimum content length
             Article.published_at >= cutoff_time  # Only recent articles
         )
     ).order_by(
-        desc(ArticleScore.opportunities_score)  # Rank by category-specific score only
+        desc(column)
     ).limit(limit).all()
     
-    # Use all articles that meet the score threshold - no additional keyword filtering
-    articles = articles[:limit]
-    
-    result = []
-    for article, score in articles:
-        # Parse takeaways from JSON
-        takeaways = []
-        if article.takeaways:
-            try:
-                takeaways = json.loads(article.takeaways) if isinstance(article.takeaways, str) else article.takeaways
-            except:
-                takeaways = []
-        
-        result.append({
-            "id": article.id,
-            "title": article.title,
-            "url": article.url,
-            "summary": article.summary,
-            "source": article.source,
-            "published_at": article.published_at.isoformat() if article.published_at else None,
-            "image_url": article.image_url or get_fallback_image(article.id),
-            "why_it_matters": article.why_it_matters or "This development represents a significant opportunity in the construction and real estate industry.",
-            "takeaways": takeaways,
-            "score": {
-                "opportunities": score.opportunities_score,
-                "total": score.total_score
-            },
-            "themes": article.themes
-        })
-    
+    result = [
+        _theme_article_payload(article, {theme: getattr(score, column.key), "total": score.total_score})
+        for article, score in articles
+    ]
     return {"articles": result, "count": len(result), "version": "v4.1.0"}
 
 
+@app.get("/api/v4/opportunities")
+@cached_response
+def get_opportunities(
+    limit: int = Query(10, ge=1, le=500),
+    min_score: float = Query(0.1, ge=0.0, le=1.0),
+    hours: int = Query(168, ge=1, le=720, description="Only articles from last N hours"),
+    db: Session = Depends(get_db)
+):
+    """Get high-relevance articles in the Opportunities category"""
+    return _theme_articles(db, "opportunities", limit, min_score, hours)
+
+
 @app.get("/api/v4/practices")
-async def get_practices(
+@cached_response
+def get_practices(
     limit: int = Query(10, ge=1, le=500),
     min_score: float = Query(0.1, ge=0.0, le=1.0),
     hours: int = Query(168, ge=1, le=720, description="Only articles from last N hours"),
     db: Session = Depends(get_db)
 ):
     """Get high-relevance articles in the Practices category"""
-    # Calculate cutoff time for recent articles
-    cutoff_time = datetime.now(timezone.utc) - timedelta(hours=hours)
-    
-    # Query using only category-specific scores (not total_score)
-    articles = db.query(Article, ArticleScore).join(
-        ArticleScore, Article.id == ArticleScore.article_id
-    ).filter(
-        and_(
-            ArticleScore.practices_score >= min_score,  # Only category-specific score
-            or_(Article.content.isnot(None), Article.summary.isnot(None)),
-            or_(func.length(Article.content) > 200, func.length(Article.summary) > 200),
-            Article.published_at >= cutoff_time  # Only recent articles
-        )
-    ).order_by(
-        desc(ArticleScore.practices_score)  # Rank by category-specific score only
-    ).limit(limit).all()
-    
-    # Use all articles that meet the score threshold - no additional keyword filtering
-    articles = articles[:limit]
-    
-    result = []
-    for article, score in articles:
-        # Parse takeaways from JSON
-        takeaways = []
-        if article.takeaways:
-            try:
-                takeaways = json.loads(article.takeaways) if isinstance(article.takeaways, str) else article.takeaways
-            except:
-                takeaways = []
-        
-        result.append({
-            "id": article.id,
-            "title": article.title,
-            "url": article.url,
-            "summary": article.summary,
-            "source": article.source,
-            "published_at": article.published_at.isoformat() if article.published_at else None,
-            "image_url": article.image_url or get_fallback_image(article.id),
-            "why_it_matters": article.why_it_matters or "This development represents a significant opportunity in the construction and real estate industry.",
-            "takeaways": takeaways,
-            "score": {
-                "practices": score.practices_score,
-                "total": score.total_score
-            },
-            "themes": article.themes
-        })
-    
-    return {"articles": result, "count": len(result), "version": "v4.1.0"}
+    return _theme_articles(db, "practices", limit, min_score, hours)
 
 
 @app.get("/api/v4/systems-codes")
-async def get_systems_codes(
+@cached_response
+def get_systems_codes(
     limit: int = Query(10, ge=1, le=500),
     min_score: float = Query(0.1, ge=0.0, le=1.0),
     hours: int = Query(168, ge=1, le=720, description="Only articles from last N hours"),
@@ -300,7 +325,8 @@ async def get_systems_codes(
 
 
 @app.get("/api/v4/vision")
-async def get_vision(
+@cached_response
+def get_vision(
     limit: int = Query(10, ge=1, le=500),
     db: Session = Depends(get_db)
 ):
@@ -313,32 +339,10 @@ async def get_vision(
         desc(ArticleScore.vision_score)
     ).limit(limit).all()
     
-    result = []
-    for article, score in articles:
-        # Parse takeaways from JSON
-        takeaways = []
-        if article.takeaways:
-            try:
-                takeaways = json.loads(article.takeaways) if isinstance(article.takeaways, str) else article.takeaways
-            except:
-                takeaways = []
-        
-        result.append({
-            "id": article.id,
-            "title": article.title,
-            "url": article.url,
-            "summary": article.summary,
-            "source": article.source,
-            "published_at": article.published_at.isoformat() if article.published_at else None,
-            "image_url": article.image_url or get_fallback_image(article.id),
-            "why_it_matters": article.why_it_matters or "This development represents a significant opportunity in the construction and real estate industry.",
-            "takeaways": takeaways,
-            "score": {
-                "vision": score.vision_score,
-                "total": score.total_score
-            },
-            "themes": article.themes
-        })
+    result = [
+        _theme_article_payload(article, {"vision": score.vision_score, "total": score.total_score})
+        for article, score in articles
+    ]
     
     return {"articles": result, "count": len(result), "version": "v4.1.0"}
 
@@ -348,7 +352,8 @@ async def get_vision(
 # ============================================================================
 
 @app.get("/api/v4/top-stories")
-async def get_top_stories(
+@cached_response
+def get_top_stories(
     limit: int = Query(10, ge=1, le=500),
     db: Session = Depends(get_db)
 ):
@@ -381,7 +386,8 @@ async def get_top_stories(
 
 
 @app.get("/api/v4/home")
-async def get_home_page(
+@cached_response
+def get_home_page(
     limit: int = Query(7, ge=1, le=500),
     hours: int = Query(168, ge=1, le=720, description="Only articles from last N hours"),
     db: Session = Depends(get_db)
@@ -458,7 +464,7 @@ async def get_home_page(
 # ============================================================================
 
 @app.get("/api/v4/insights/high-impact")
-async def get_high_impact_insights(
+def get_high_impact_insights(
     limit: int = Query(10, ge=1, le=500),
     db: Session = Depends(get_db)
 ):
@@ -490,7 +496,7 @@ async def get_high_impact_insights(
 
 
 @app.get("/api/v4/insights/methodology")
-async def get_methodology_insights(
+def get_methodology_insights(
     limit: int = Query(10, ge=1, le=500),
     db: Session = Depends(get_db)
 ):
@@ -526,7 +532,7 @@ async def get_methodology_insights(
 # ============================================================================
 
 @app.get("/api/v4/developer/opportunities")
-async def get_developer_opportunities(
+def get_developer_opportunities(
     limit: int = Query(10, ge=1, le=500),
     db: Session = Depends(get_db)
 ):
@@ -564,7 +570,7 @@ async def get_developer_opportunities(
 # ============================================================================
 
 @app.get("/api/v4/synthesis/daily-brief")
-async def get_daily_brief(
+def get_daily_brief(
     days_back: int = Query(1, ge=1, le=7),
     db: Session = Depends(get_db)
 ):
@@ -629,7 +635,7 @@ async def collect_articles():
         
         for article_data in articles:
             # Check if article already exists
-            existing = db.query(Article).filter(Article.url == article_data.url).first()
+            existing = db.query(Article.id).filter(Article.url == article_data.url).first()
             if existing:
                 continue
             
@@ -721,7 +727,7 @@ async def collect_corporate_articles():
         
         for article_data in articles:
             # Check if article already exists
-            existing = db.query(Article).filter(Article.url == article_data.url).first()
+            existing = db.query(Article.id).filter(Article.url == article_data.url).first()
             if existing:
                 continue
             
@@ -792,7 +798,7 @@ async def collect_corporate_articles():
 
 
 @app.post("/api/v4/admin/migrate-add-image-url")
-async def migrate_add_image_url():
+def migrate_add_image_url():
     """Add image_url column to articles_v4 table"""
     try:
         db = SessionLocal()
@@ -837,7 +843,7 @@ async def migrate_add_image_url():
 
 
 @app.delete("/api/v4/admin/clear-articles")
-async def clear_all_articles():
+def clear_all_articles():
     """Clear all articles and scores from the database"""
     try:
         db = SessionLocal()
@@ -962,7 +968,7 @@ async def force_extract_images_for_fallback_articles():
 
 
 @app.post("/api/v4/admin/score")
-async def run_scoring():
+def run_scoring():
     """Run scoring on all unscored articles"""
     try:
         db = SessionLocal()
@@ -1028,7 +1034,7 @@ async def process_videos():
             scores = video_result["scores"]
             
             # Check if video already exists
-            existing = db.query(Video).filter(Video.youtube_id == video_data.youtube_id).first()
+            existing = db.query(Video.id).filter(Video.youtube_id == video_data.youtube_id).first()
             if existing:
                 continue
             
@@ -1067,7 +1073,7 @@ async def process_videos():
 
 
 @app.get("/api/v4/admin/debug-scores")
-async def debug_scores(db: Session = Depends(get_db)):
+def debug_scores(db: Session = Depends(get_db)):
     """Debug endpoint to check article scores"""
     articles = db.query(Article, ArticleScore).join(
         ArticleScore, Article.id == ArticleScore.article_id
@@ -1089,16 +1095,18 @@ async def debug_scores(db: Session = Depends(get_db)):
 
 
 @app.get("/api/v4/admin/stats")
-async def get_admin_stats(db: Session = Depends(get_db)):
+def get_admin_stats(db: Session = Depends(get_db)):
     """Get admin statistics"""
-    total_articles = db.query(Article).count()
-    scored_articles = db.query(ArticleScore).count()
-    total_videos = db.query(Video).count()
-    total_insights = db.query(ArticleInsight).count()
-    
-    recent_articles = db.query(Article).filter(
-        Article.created_at >= datetime.now(timezone.utc) - timedelta(days=1)
-    ).count()
+    # All five counts in one round-trip: the article totals come from a single
+    # pass with COUNT(*) FILTER, the other tables as scalar subqueries
+    since = datetime.now(timezone.utc) - timedelta(days=1)
+    total_articles, recent_articles, scored_articles, total_videos, total_insights = db.query(
+        func.count(Article.id),
+        func.count(Article.id).filter(Article.created_at >= since),
+        db.query(func.count(ArticleScore.id)).scalar_subquery(),
+        db.query(func.count(Video.id)).scalar_subquery(),
+        db.query(func.count(ArticleInsight.id)).scalar_subquery()
+    ).one()
     
     return {
         "total_articles": total_articles,
@@ -1211,7 +1219,7 @@ async def serve_dashboard():
         return f"Error loading dashboard: {str(e)}"
 
 @app.post("/api/v4/admin/migrate-add-content-fields")
-async def migrate_add_content_fields():
+def migrate_add_content_fields():
     """Add why_it_matters and takeaways columns to articles_v4 table"""
     try:
         db = SessionLocal()
@@ -1264,7 +1272,7 @@ async def migrate_add_content_fields():
         }
 
 @app.post("/api/v4/admin/generate-content")
-async def generate_content_for_articles(
+def generate_content_for_articles(
     limit: int = Query(50, ge=1, le=500, description="Number of articles to process"),
     hours: int = Query(168, ge=1, le=720, description="Only articles from last N hours"),
     db: Session = Depends(get_db)
@@ -1330,22 +1338,28 @@ async def generate_content_for_articles(
         processed_count = 0
         error_count = 0
         
-        for article, score in articles:
-            try:
+        # Generate content using OpenAI, with the per-article requests issued
+        # concurrently; results are applied on this thread as they arrive
+        generated = openai_generator.generate_content_batch([
+            {
+                "title": article.title,
+                "content": article.content or "",
+                "summary": article.summary or "",
                 # Get theme scores from the scoring result
-                theme_scores = {
+                "theme_scores": {
                     "opportunities": score.opportunities_score,
                     "practices": score.practices_score,
                     "vision": score.vision_score
                 }
-                
-                # Generate content using OpenAI
-                generated_content = openai_generator.generate_article_content(
-                    title=article.title,
-                    content=article.content or "",
-                    summary=article.summary or "",
-                    theme_scores=theme_scores
-                )
+            }
+            for article, score in articles
+        ])
+        
+        for index, generated_content in generated:
+            article, _ = articles[index]
+            try:
+                if generated_content is None:
+                    raise ValueError("content generation failed")
                 
                 # Update article with generated content
                 article.why_it_matters = generated_content["why_it_matters"]
@@ -1383,7 +1397,7 @@ async def generate_content_for_articles(
 
 
 @app.post("/api/v4/admin/cleanup-old-articles")
-async def cleanup_old_articles(
+def cleanup_old_articles(
     days: int = Query(7, ge=1, le=30, description="Delete articles older than N days"),
     db: Session = Depends(get_db)
 ):
@@ -23,6 +23,8 @@ class APIConfig:
     version: str = "4.0.0"
     debug: bool = os.getenv("DEBUG", "false").lower() == "true"
     cors_origins: List[str] = None
+    # Read endpoints serve cached payloads for this many seconds (0 disables)
+    response_cache_ttl: int = int(os.getenv("RESPONSE_CACHE_TTL", "60"))
 
     def __post_init__(self):
         if self.cors_origins is None:
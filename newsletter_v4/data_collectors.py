@@ -4,13 +4,14 @@ Clean, modular data collectors for RSS, Google, and web scraping
 """
 
 import asyncio
+import calendar
 import aiohttp
 import feedparser
 import json
 from typing import List, Dict, Optional, AsyncGenerator
 from datetime import datetime, timezone, timedelta
 from urllib.parse import urljoin, urlparse
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 import time
 from dataclasses import dataclass
 
@@ -53,15 +54,16 @@ class RSSCollector:
         """Fetch articles from a single RSS feed (only articles from past 72 hours)"""
         try:
             # All RSS feeds: 7 days (168 hours) to get more sources
-            cutoff_time = datetime.now(timezone.utc) - timedelta(hours=168)
+            now = datetime.now(timezone.utc)
+            cutoff_time = now - timedelta(hours=168)
             
             async with self.session.get(feed_url) as response:
                 if response.status != 200:
                     print(f"RSS feed error: {feed_url} - Status {response.status}")
                     return []
                 
-                content = await response.text()
-                feed = feedparser.parse(content)
+                body = await response.read()
+                feed = feedparser.parse(body)
                 
                 articles = []
                 for entry in feed.entries[:self.config.data_sources.max_articles_per_source]:
@@ -77,19 +79,18 @@ class RSSCollector:
                     published_at = None
                     
                     # Try multiple date fields
-                    if hasattr(entry, 'published_parsed') and entry.published_parsed:
-                        published_at = datetime(*entry.published_parsed[:6], tzinfo=timezone.utc)
-                    elif hasattr(entry, 'updated_parsed') and entry.updated_parsed:
-                        published_at = datetime(*entry.updated_parsed[:6], tzinfo=timezone.utc)
+                    published_parsed = entry.get('published_parsed')
+                    parsed = published_parsed or entry.get('updated_parsed')
+                    if parsed:
+                        published_at = datetime.fromtimestamp(calendar.timegm(parsed), tz=timezone.utc)
                     else:
                         # If no date available, assume it's recent (within 72 hours)
                         # This is more permissive for feeds that don't provide dates
-                        published_at = datetime.now(timezone.utc)
+                        published_at = now
                     
                     # Skip articles older than cutoff time (only if we have a real date)
-                    if hasattr(entry, 'published_parsed') and entry.published_parsed:
-                        if published_at < cutoff_time:
-                            continue
+                    if published_parsed and published_at < cutoff_time:
+                        continue
                     
                     # Extract content
                     content = ""
@@ -223,6 +224,11 @@ class GoogleCollector:
         return all_articles
 
 
+# Only the tags scrape_article reads; everything else (head scripts, nav, footers
+# outside a div) is never built into the tree.
+ARTICLE_STRAINER = SoupStrainer(['title', 'h1', 'article', 'main', 'div', 'p', 'meta'])
+
+
 class WebScraper:
     """Scrapes articles from web pages"""
     
@@ -251,7 +257,9 @@ class WebScraper:
                     return None
                 
                 html = await response.text()
-                soup = BeautifulSoup(html, 'html.parser')
+                soup = BeautifulSoup(html, 'lxml', parse_only=ARTICLE_STRAINER)
+                for tag in soup(['script', 'style']):
+                    tag.decompose()
                 
                 # Extract title
                 title = ""
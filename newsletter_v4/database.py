@@ -13,8 +13,13 @@ def get_database_url():
     config = get_config()
     return config.database.url
 
+_engine = None
+
 def create_database_engine():
-    """Create database engine with PostgreSQL support"""
+    """Create database engine with PostgreSQL support (one shared engine per process)"""
+    global _engine
+    if _engine is not None:
+        return _engine
     url = get_database_url()
     
     # PostgreSQL-specific engine configuration
@@ -32,6 +37,7 @@ def create_database_engine():
         # SQLite fallback
         engine = create_engine(url, echo=False)
     
+    _engine = engine
     return engine
 
 def get_session_maker():
@@ -56,6 +62,11 @@ def create_tables():
         from .models import Base
         engine = create_database_engine()
         Base.metadata.create_all(bind=engine)
+        # create_all skips tables that already exist, indexes included, so
+        # indexes added to the models later are created here
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(bind=engine, checkfirst=True)
         print("✅ Database tables created successfully")
         return True
     except Exception as e:
@@ -5,7 +5,7 @@ Clean, modern SQLAlchemy models
 
 from datetime import datetime, timezone
 from typing import Optional
-from sqlalchemy import Column, Integer, String, Text, Float, DateTime, Boolean, ForeignKey, JSON
+from sqlalchemy import Column, Integer, String, Text, Float, DateTime, Boolean, ForeignKey, JSON, Index
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -76,6 +76,15 @@ class ArticleScore(Base):
     
     # Relationships
     article = relationship("Article", back_populates="scores")
+    
+    # Ranking indexes matching the theme endpoints' ORDER BY, so each top-N
+    # query walks the index and stops at LIMIT instead of sorting every score
+    __table_args__ = (
+        Index("idx_scores_v4_opportunities", opportunities_score.desc()),
+        Index("idx_scores_v4_practices", practices_score.desc()),
+        Index("idx_scores_v4_vision", vision_score.desc()),
+        Index("idx_scores_v4_total_systems", total_score.desc(), systems_score.desc()),
+    )
 
 
 class ArticleInsight(Base):
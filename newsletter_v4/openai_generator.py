@@ -1,8 +1,36 @@
 import openai
 import json
 import re
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+# HTML tag stripper for article bodies, compiled once
+_TAG_RE = re.compile(r'<[^>]*>')
+_BULLET_MARKERS = ('-', '•', '*')
+
+# System prompts are built once at import so each call sends a byte-identical
+# prefix (no per-call formatting, and the provider's prompt cache can match it)
+TAKEAWAYS_SYSTEM = """You are an expert content analyst for the construction and real estate industry.
+Extract the 3 most important, actionable or interesting insights from the article. Prioritize:
+- specific numbers, percentages and metrics
+- business implications and ROI
+- market trends and opportunities
+- technical innovations and methods
+- regulatory or policy changes
+Start each bullet with ✅; be concise but specific, never generic."""
+
+_THEME_CONTEXTS = {
+    "development_deals": "This article is about development deals, investment opportunities, ROI, and wealth creation in real estate development.",
+    "building_better": "This article is about construction innovation, building practices, prefabrication, modular construction, and efficiency improvements.",
+    "forces_frameworks": "This article is about policy changes, zoning reforms, demographic shifts, infrastructure investment, and market forces."
+}
+
+WHY_IT_MATTERS_SYSTEM = {
+    theme: f"""You are an expert construction and real estate analyst. {context}
+In 1-2 confident sentences, explain why this article matters to industry professionals: business impact and opportunities, market implications and competitive advantage, ROI and strategic positioning, or industry transformation. Be specific, never generic."""
+    for theme, context in _THEME_CONTEXTS.items()
+}
 
 class OpenAIContentGenerator:
     def __init__(self, api_key: str):
@@ -17,10 +45,10 @@ class OpenAIContentGenerator:
         full_content = f"Title: {title}\n\n"
         if content:
             # Remove HTML tags and clean content
-            clean_content = re.sub(r'<[^>]*>', '', content)
+            clean_content = _TAG_RE.sub('', content)
             full_content += f"Content: {clean_content[:2000]}\n\n"  # Limit content length
         if summary:
-            clean_summary = re.sub(r'<[^>]*>', '', summary)
+            clean_summary = _TAG_RE.sub('', summary)
             full_content += f"Summary: {clean_summary}"
         
         try:
@@ -29,17 +57,7 @@ class OpenAIContentGenerator:
                 messages=[
                     {
                         "role": "system",
-                        "content": """You are an expert content analyst for the construction and real estate industry. 
-                        Your task is to extract 3 key bullet points from articles that highlight the most important, 
-                        actionable, or interesting insights. Focus on:
-                        - Specific data points, numbers, percentages, or metrics
-                        - Business implications and ROI insights
-                        - Market trends and opportunities
-                        - Technical innovations or methodologies
-                        - Regulatory or policy changes
-                        
-                        Each bullet point should start with a green checkmark emoji (✅) and be concise but informative.
-                        Avoid generic statements - extract the meat and potatoes of the article."""
+                        "content": TAKEAWAYS_SYSTEM
                     },
                     {
                         "role": "user",
@@ -53,20 +71,24 @@ class OpenAIContentGenerator:
             # Parse the response and format as bullet points
             content = response.choices[0].message.content.strip()
             
-            # Split into bullet points and clean them up
+            # Split into bullet points and clean them up, dropping bullets the
+            # model repeated (compared case/whitespace-insensitively)
             bullets = []
+            seen = set()
             for line in content.split('\n'):
                 line = line.strip()
                 if line:
                     # Remove common bullet markers
-                    if line.startswith('-') or line.startswith('•') or line.startswith('*'):
+                    if line.startswith(_BULLET_MARKERS):
                         line = line[1:].strip()
                     
                     # Ensure checkmark is present
                     if not line.startswith('✅'):
                         line = f"✅ {line}"
                     
-                    if len(line) > 15:  # Only include substantial bullets
+                    key = line[1:].strip().lower()
+                    if len(line) > 15 and key not in seen:  # Only include substantial bullets
+                        seen.add(key)
                         bullets.append(line)
             
             # Ensure we have exactly 3 bullets
@@ -107,38 +129,19 @@ class OpenAIContentGenerator:
         # Clean and prepare content
         full_content = f"Title: {title}\n\n"
         if content:
-            clean_content = re.sub(r'<[^>]*>', '', content)
+            clean_content = _TAG_RE.sub('', content)
             full_content += f"Content: {clean_content[:2000]}\n\n"
         if summary:
-            clean_summary = re.sub(r'<[^>]*>', '', summary)
+            clean_summary = _TAG_RE.sub('', summary)
             full_content += f"Summary: {clean_summary}"
         
-        # Theme-specific prompts
-        theme_contexts = {
-            "development_deals": "This article is about development deals, investment opportunities, ROI, and wealth creation in real estate development.",
-            "building_better": "This article is about construction innovation, building practices, prefabrication, modular construction, and efficiency improvements.",
-            "forces_frameworks": "This article is about policy changes, zoning reforms, demographic shifts, infrastructure investment, and market forces."
-        }
-        
-        theme_context = theme_contexts.get(most_relevant_theme, theme_contexts["development_deals"])
-        
         try:
             response = self.client.chat.completions.create(
                 model="gpt-3.5-turbo",
                 messages=[
                     {
                         "role": "system",
-                        "content": f"""You are an expert construction and real estate analyst. {theme_context}
-                        
-                        Your task is to write a compelling 1-2 sentence explanation of why this article matters to industry professionals.
-                        Focus on:
-                        - Specific business impact and opportunities
-                        - Market implications and competitive advantages
-                        - ROI potential and strategic positioning
-                        - Industry transformation and future trends
-                        
-                        Write in a confident, insightful tone that helps readers understand the strategic importance.
-                        Be specific about the impact and avoid generic statements."""
+                        "content": WHY_IT_MATTERS_SYSTEM[most_relevant_theme]
                     },
                     {
                         "role": "user", 
@@ -167,6 +170,26 @@ class OpenAIContentGenerator:
             "why_it_matters": self.generate_why_it_matters(title, content, summary, theme_scores),
             "takeaways": self.generate_takeaways(title, content, summary)
         }
+    
+    def generate_content_batch(self, items: List[Dict], max_workers: int = 8) -> Iterator[Tuple[int, Optional[Dict]]]:
+        """Generate content for many articles with requests in flight concurrently.
+        
+        Each item holds generate_article_content's keyword arguments. Yields
+        (index, content) pairs as each article finishes, so callers can persist
+        results incrementally; content is None when that article failed. The
+        OpenAI client is thread-safe and the calls are network-bound.
+        """
+        def _one(item: Dict) -> Optional[Dict]:
+            try:
+                return self.generate_article_content(**item)
+            except Exception as e:
+                print(f"Error generating content for {item.get('title', '')[:60]}: {e}")
+                return None
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = {pool.submit(_one, item): i for i, item in enumerate(items)}
+            for future in as_completed(futures):
+                yield futures[future], future.result()
 
 def get_openai_generator() -> Optional[OpenAIContentGenerator]:
     """Get OpenAI content generator if API key is available"""